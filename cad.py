@@ -5,18 +5,137 @@ Author: Arushi
 
 import sys
 import math
+from collections import OrderedDict
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QLabel, QSpinBox, QDoubleSpinBox,
                                QPushButton, QComboBox, QGroupBox, QGridLayout,
                                QScrollArea, QFileDialog, QSplitter, QMessageBox,
-                               QTextEdit)
-from PySide6.QtCore import Qt, QRectF, QPointF, QTimer
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPolygonF, QPixmap, QPainterPath
+                               QTextEdit, QAbstractSpinBox)
+from PySide6.QtCore import (Qt, QRect, QRectF, QPointF, QLineF, QTimer, QSignalBlocker, QObject, Signal,
+                            QRunnable, QThreadPool)
+from PySide6.QtGui import (QPainter, QPen, QColor, QFont, QBrush, QPolygonF, QPixmap, QPainterPath,
+                           QImage, QFontMetrics, QRegion, QTransform, QStaticText)
+
+
+# status label styles, applied only when switching between info and warning
+_STATUS_CSS_INFO = """
+    QLabel {
+        background-color: #f0f9ff;
+        color: #1e40af;
+        padding: 8px;
+        border: 1px solid #bfdbfe;
+        border-radius: 4px;
+        font-size: 9px;
+    }
+"""
+_STATUS_CSS_WARN = """
+    QLabel {
+        background-color: #fef3c7;
+        color: #92400e;
+        padding: 8px;
+        border: 1px solid #fbbf24;
+        border-radius: 4px;
+        font-size: 9px;
+    }
+"""
+
+
+def _dashed_pen(color, width, pattern):
+    """pen with a custom dash pattern, QPen has no constructor taking one"""
+    pen = QPen(color, width, Qt.CustomDashLine)
+    pen.setDashPattern(pattern)
+    return pen
 
 
 class BridgeCADWidget(QWidget):
     """widget for drawing bridge CAD views """
     
+    # RCC railing outer width (mm), see draw_railing_post_fixed
+    RAILING_OUTER_WIDTH_MM = 375
+    _RAILING_HEIGHT_MM = 1100
+    
+    # shared drawing tools for dimensions and labels (QFonts are built per instance,
+    # a QFont made before the QApplication resolves to different metrics)
+    _COLOR_BLACK = QColor(0, 0, 0)
+    _COLOR_LABEL_BG = QColor(255, 255, 255, 240)
+    # cross-section hover label text, its lighter background and leader line
+    _COLOR_HOVER_TEXT = QColor(60, 60, 60)
+    _COLOR_HOVER_BG = QColor(255, 255, 255, 220)
+    _COLOR_HOVER_LEADER = QColor(120, 120, 120)
+    _PEN_BLACK = QPen(QColor(0, 0, 0), 0.8)
+    _PEN_DIM = QPen(QColor(100, 100, 100), 0.8, Qt.DotLine)
+    _PEN_LEADER = QPen(QColor(0, 0, 0), 1.0)
+    _PEN_OUTLINE = QPen(QColor(0, 0, 0), 2)
+    _PEN_THIN = QPen(QColor(0, 0, 0), 1.5)
+    _PEN_HOVER_LEADER = QPen(QColor(100, 100, 100), 1.0, Qt.DotLine)
+    _PEN_HOVER_RING = QPen(QColor(100, 100, 100), 1.5)
+    _BRUSH_BLACK = QBrush(QColor(0, 0, 0))
+    _BRUSH_LABEL_BG = QBrush(_COLOR_LABEL_BG)
+    
+    # member drawing tools
+    _PEN_STIFFENER = QPen(QColor(0, 0, 0), 1)
+    _BRUSH_BARRIER = QBrush(QColor(255, 210, 160))
+    _BRUSH_DECK = QBrush(QColor(200, 200, 200))
+    _BRUSH_FOOTPATH = QBrush(QColor(220, 220, 220))
+    _BRUSH_BRACING_PANEL = QBrush(QColor(255, 240, 220, 100))
+    _PEN_BRACING = QPen(QColor(255, 140, 0), 1.0)
+    # tiny dashes where the footpaths join the deck
+    _PEN_DASHED_JOIN = _dashed_pen(QColor(0, 0, 0), 1.5, [2, 2])
+    _PEN_NOTE = QPen(QColor(40, 40, 40), 1)
+    # irc crash barrier profile (mm) from its outer bottom corner, front face to the right:
+    # 350 wide base 100 high, front slope through 250 at 350 up, 175 wide top at 900
+    _BARRIER_PROFILE_MM = QPolygonF([
+        QPointF(0, 0), QPointF(350, 0), QPointF(350, -100), QPointF(250, -350),
+        QPointF(225, -900), QPointF(50, -900), QPointF(0, -100),
+    ])
+    
+    # top view member colours, also the text of their hover leader labels
+    _COLOR_TOP_GIRDER = QColor(0, 100, 0)
+    _COLOR_TOP_DIAPHRAGM = QColor(139, 69, 19)
+    _COLOR_TOP_BRACING = QColor(255, 140, 0)
+    _COLOR_TOP_BRACING_LEADER = QColor(200, 100, 0)
+    
+    # top view member pens as (normal, hovered), indexed by the hover flag
+    _PEN_TOP_GIRDER = (QPen(_COLOR_TOP_GIRDER, 2.5), QPen(QColor(0, 200, 0), 4.5))
+    _PEN_TOP_DIAPHRAGM = (QPen(_COLOR_TOP_DIAPHRAGM, 3.0), QPen(QColor(200, 120, 50), 4.0))
+    _PEN_TOP_BRACING = (QPen(_COLOR_TOP_BRACING, 1.8), QPen(QColor(255, 200, 50), 3.5))
+    _PEN_TOP_BEARING = (_dashed_pen(QColor(255, 0, 0), 1.5, [8, 8]),
+                        _dashed_pen(QColor(255, 100, 100), 2.5, [8, 8]))
+    _PEN_TOP_MEMBER = {'girder': _PEN_TOP_GIRDER, 'end_diaphragm': _PEN_TOP_DIAPHRAGM,
+                       'bearing': _PEN_TOP_BEARING, 'cross_bracing': _PEN_TOP_BRACING}
+    
+    # skew angle indicator
+    _PEN_SKEW_REFERENCE = QPen(QColor(100, 100, 100), 1.5, Qt.DashLine)
+    _PEN_SKEW_LINE = QPen(QColor(0, 100, 200), 2.0)
+    _PEN_SKEW_ARC = QPen(QColor(0, 100, 200), 2.5)
+    _BRUSH_SKEW = QBrush(QColor(0, 100, 200))
+    
+    # 4 px dimension arrow heads with the tip at the origin, see _draw_arrow_head
+    _ARROW_H_LEFT = QPolygonF([QPointF(0, 0), QPointF(4, -2), QPointF(4, 2)])
+    _ARROW_H_RIGHT = QPolygonF([QPointF(0, 0), QPointF(-4, -2), QPointF(-4, 2)])
+    _ARROW_V_TOP = QPolygonF([QPointF(0, 0), QPointF(-2, 4), QPointF(2, 4)])
+    _ARROW_V_BOTTOM = QPolygonF([QPointF(0, 0), QPointF(-2, -4), QPointF(2, -4)])
+    # skewed dimension arrow head for a line along +x, barbs 2.5 rad either side;
+    # rotated onto the line with a QTransform, see draw_skewed_dimension_arrow
+    _ARROW_ALONG_X = QPolygonF([QPointF(0, 0),
+                                QPointF(4 * math.cos(-2.5), 4 * math.sin(-2.5)),
+                                QPointF(4 * math.cos(2.5), 4 * math.sin(2.5))])
+    # leader arrow barbs sit 30 degrees either side of the leader
+    _LEADER_BARB_COS = math.cos(math.pi / 6)
+    _LEADER_BARB_SIN = math.sin(math.pi / 6)
+    
+    # text sizes per (font key, device dpi), see _text_size
+    _TEXT_SIZE_CACHE = {}
+    _TEXT_METRICS = {}
+    # multi-line text layouts per (text, font key, device dpi), see _text_block
+    _TEXT_BLOCK_CACHE = {}
+    # laid out glyph runs of dimension text lines drawn straight to the view, see _static_text
+    _STATIC_TEXT_CACHE = {}
+    # rendered text labels kept per widget, least recently used dropped first
+    _LABEL_PIXMAP_LIMIT = 256
+    # cell size in px of the top view hover grid, see _top_view_hover_cell
+    _HOVER_CELL = 64
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(900, 600)
@@ -28,8 +147,51 @@ class BridgeCADWidget(QWidget):
         self.hovered_label_index = -1
         
         # top view hover tracking 
-        self.top_view_hover_zones = []  # list of (QRectF, element_type)
+        # list of plain float (left, top, right, bottom, element_type) bounds
+        self.top_view_hover_zones = []
         self.hovered_top_view_element = None
+        # (cx, cy) -> the top_view_hover_zones overlapping that cell, in zone order,
+        # built on the first hit test after a render
+        self._top_view_hover_grid = None
+        # hover highlight geometry laid out by draw_top_view, see draw_top_view_hover
+        self._top_view_hover_shapes = {}
+        self._top_view_hover_leaders = {}
+        
+        # static drawing (everything but the hovered label or member) per view type,
+        # view_type -> (key, image); reused while params/size are unchanged, so hover
+        # only repaints the overlay and switching views back is a blit
+        self._chrome_layers = {}
+        self._params_version = 0  # bumped by update_params, part of the layer key
+        
+        # cross-section hover components, (rect, name, target_x, target_y, label_type, extra),
+        # rebuilt by _compute_hover_regions once params or size have changed
+        self._hover_components = []
+        self._hover_label_line_y = 0
+        self._hover_regions_dirty = True
+        self._hover_bounds = []  # (left, top, right, bottom) per component, for hit-testing
+        
+        # (deck_total, num_fp) from compute_deck_total_width and the params it came from
+        self._deck_geom_cache = None
+        self._deck_geom_key = None
+        
+        # a burst of update_params calls results in one repaint once events drain
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(0)
+        self._repaint_timer.timeout.connect(self.update)
+        
+        # top view notes block, re-rendered only when its text changes
+        self._notes_pixmap = None
+        self._notes_key = None
+        
+        # (key, pixmap) of the railing post drawing, see draw_railing_post_fixed
+        self._railing_sprite = None
+        
+        # arrow heads collected while the static layer renders, see _draw_arrow_head
+        self._arrow_path = None
+        
+        # QLineF objects reused between draw calls, see _pooled_lines
+        self._line_pool = []
         
         # bridge parameters with default values (all in mm)
         self.params = {
@@ -87,13 +249,63 @@ class BridgeCADWidget(QWidget):
             'width': 100,
         }
         
+        self._labels = {}
+        self._rebuild_label_cache()
+        
+        self._font_label = QFont('Arial', 7, QFont.Bold)
+        self._font_note = QFont('Arial', 7)
+        self._label_pixmaps = OrderedDict()
+        self._label_fonts = {(7, True): self._font_label}
+        
     def set_view_type(self, view_type):
         self.view_type = view_type
         self.update()
         
     def update_params(self, params):
         self.params.update(params)
-        self.update()
+        self._params_version += 1
+        self._deck_geom_key = None
+        self._rebuild_label_cache()
+        self._chrome_layers.clear()
+        self._hover_regions_dirty = True
+        self._repaint_timer.start()
+
+    def resizeEvent(self, event):
+        # cached layers of both views are for the old size, drop them rather than
+        # keeping a stale image alive until each view is painted again
+        self._chrome_layers.clear()
+        self._hover_regions_dirty = True
+        super().resizeEvent(event)
+
+    def _rebuild_label_cache(self):
+        """format the dimension label strings (and the skew sin/cos) once per parameter change"""
+        p = self.params
+        deck_total, _ = self.compute_deck_total_width()
+        cw_m = p['carriageway_width'] / 1000
+        gs_m = p['girder_spacing'] / 1000
+        skew_deg = p['skew_angle']
+        
+        # used by the skew angle indicator, derived here so any update_params caller keeps them in sync
+        skew_rad = math.radians(skew_deg)
+        self._skew_sin = math.sin(skew_rad)
+        self._skew_cos = math.cos(skew_rad)
+        
+        self._labels = {
+            'overall_width': f"Overall Bridge Width = {deck_total / 1000.0:.2f} m",
+            'footpath_width_m': (p['footpath_width'] - self.RAILING_OUTER_WIDTH_MM) / 1000,
+            'carriageway': f"Carriageway = {cw_m:.2f} m",
+            'carriageway_width': f"Carriageway Width = {cw_m:.2f} m",
+            'median': f"Median = {p['median_width'] / 1000:.2f} m",
+            'overhang': f"Overhang = {p['deck_overhang'] / 1000:.2f} m",
+            'girder_spacing': f"Girder Spacing = {gs_m:.2f} m",
+            'girder_spacing_stacked': f"Girder\nSpacing\n= {gs_m:.2f} m",
+            'footpath_thickness': f"Footpath\nThickness = {p['footpath_thickness']:.0f} mm",
+            'deck_thickness': f"Deck Thickness = {p['deck_thickness']:.0f} mm",
+            'span': f"Span Length = {p['span_length'] / 1000:.1f} m",
+            'bracing_spacing': f"Bracing Spacing = {p['cross_bracing_spacing'] / 1000:.2f} m",
+            'skew': f"Skew = +{abs(skew_deg):.1f}°" if skew_deg >= 0 else f"Skew = {skew_deg:.1f}°",
+        }
+        self._labels['footpath_width'] = f"Footpath Width = {self._labels['footpath_width_m']:.2f} m"
     
     def mouseMoveEvent(self, event):
         """mouse moving text showing"""
@@ -101,36 +313,82 @@ class BridgeCADWidget(QWidget):
         
         if self.view_type == 'cross-section':
             # Cross-section hover logic
+            self._compute_hover_regions()
+            # plain float compares, no QRectF.contains call into Qt per region
+            x, y = pos.x(), pos.y()
             new_hovered = -1
-            for i, (rect, text, bg_color, text_color) in enumerate(self.hover_labels):
-                if rect.contains(pos):
+            for i, (left, top, right, bottom) in enumerate(self._hover_bounds):
+                if left <= x <= right and top <= y <= bottom:
                     new_hovered = i
                     break
             
             if new_hovered != self.hovered_label_index:
+                # only the old and new label areas need repainting over the cached layer
+                dirty = QRegion()
+                for index in (self.hovered_label_index, new_hovered):
+                    rect = self._hover_label_rect(index)
+                    if rect is not None:
+                        dirty = dirty.united(rect.toAlignedRect())
                 self.hovered_label_index = new_hovered
-                self.update()
+                if not dirty.isEmpty():
+                    self.update(dirty)
         else:
-            # top view hover logic
+            # top view hover logic, only the zones in the cell under the cursor are tested
+            x, y = pos.x(), pos.y()
             new_hovered = None
-            for rect, element_type in self.top_view_hover_zones:
-                if rect.contains(pos):
+            for left, top, right, bottom, element_type in self._top_view_hover_cell(x, y):
+                if left <= x <= right and top <= y <= bottom:
                     new_hovered = element_type
                     break
             
             if new_hovered != self.hovered_top_view_element:
+                # only the old and new highlighted members repaint over the cached layer
+                dirty = self._top_view_hover_region(self.hovered_top_view_element).united(
+                    self._top_view_hover_region(new_hovered))
                 self.hovered_top_view_element = new_hovered
-                self.update()
+                if not dirty.isEmpty():
+                    self.update(dirty)
+
+    def _top_view_hover_region(self, element):
+        """widget area draw_top_view_hover paints for element, empty when it paints nothing"""
+        boxes = []
+        lines = self._top_view_hover_shapes.get(element)
+        if lines is not None:
+            # half the widest highlight pen plus antialiasing around each line
+            for line in lines:
+                boxes.append((min(line.x1(), line.x2()) - 4, min(line.y1(), line.y2()) - 4,
+                              max(line.x1(), line.x2()) + 4, max(line.y1(), line.y2()) + 4))
+        leader = self._top_view_hover_leaders.get(element)
+        if leader is not None:
+            # target ring, leader line and the label box on either side of label_x
+            target_x, target_y, label_x, label_y, text = leader[:5]
+            text_width, text_height, _ = self._text_size(text, self._font_label)
+            boxes.append((min(target_x, label_x - text_width - 5) - 6, min(target_y, label_y - text_height) - 6,
+                          max(target_x, label_x + text_width + 5) + 6, max(target_y, label_y + text_height) + 6))
+        region = QRegion()
+        for left, top, right, bottom in boxes:
+            region = region.united(QRectF(left, top, right - left, bottom - top).toAlignedRect())
+        return region
+
+    def _top_view_hover_cell(self, x, y):
+        """top view hover zones overlapping the grid cell at (x, y), first registered first"""
+        if self._top_view_hover_grid is None:
+            cell = self._HOVER_CELL
+            grid = self._top_view_hover_grid = {}
+            for bounds in self.top_view_hover_zones:
+                for cx in range(math.floor(bounds[0] / cell), math.floor(bounds[2] / cell) + 1):
+                    for cy in range(math.floor(bounds[1] / cell), math.floor(bounds[3] / cell) + 1):
+                        grid.setdefault((cx, cy), []).append(bounds)
+        return self._top_view_hover_grid.get((math.floor(x / self._HOVER_CELL),
+                                              math.floor(y / self._HOVER_CELL)), ())
 
     def register_hover_label(self, x, y, text, bg_color, text_color, font_size=7):
         """lables for catching hover hovering"""
-        font = QFont('Arial', font_size, QFont.Bold)
-        metrics = self.fontMetrics()
-        text_rect = metrics.boundingRect(text)
+        text_width, text_height, _ = self._text_size(text, self.font())
         
         padding = 5
-        hover_rect = QRectF(x - padding, y - text_rect.height() - padding,
-                            text_rect.width() + 2*padding + 20, text_rect.height() + 2*padding + 10)
+        hover_rect = QRectF(x - padding, y - text_height - padding,
+                            text_width + 2*padding + 20, text_height + 2*padding + 10)
         
         self.hover_labels.append((hover_rect, text, bg_color, text_color))
         return len(self.hover_labels) - 1
@@ -141,180 +399,261 @@ class BridgeCADWidget(QWidget):
             self.draw_text_with_background(painter, x, y, text, bg_color, text_color, font_size, True)
         
     def paintEvent(self, event):
-        # clear hover labels at start of each paint
-        self.hover_labels = []
+        # device pixel ratio too: moving to a screen with another scale factor re-renders
+        key = (self._params_version, self.width(), self.height(), self.devicePixelRatioF())
+        layer = self._chrome_layers.get(self.view_type)
+        if layer is None or layer[0] != key:
+            layer = self._chrome_layers[self.view_type] = (key, self.render_frame())
         
+        exposed = event.region()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRegion(exposed)
+        painter.drawImage(0, 0, layer[1])
+        if self.view_type == 'cross-section' and self.hovered_label_index >= 0:
+            self._compute_hover_regions()
+            # skip the label when only some other part of the widget is exposed
+            label_rect = self._hover_label_rect(self.hovered_label_index)
+            if label_rect is not None and exposed.intersects(label_rect.toAlignedRect()):
+                painter.setRenderHint(QPainter.Antialiasing)
+                self.draw_cross_section_hover_label(painter)
+        elif self.view_type != 'cross-section' and self.hovered_top_view_element is not None:
+            self.draw_top_view_hover(painter)
+        painter.end()
+
+    def render_frame(self):
+        """render the static part of the current view into an off-screen image"""
+        dpr = self.devicePixelRatioF()
+        image = QImage(self.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        
+        # aliased by default: the drawing is mostly axis-aligned lines and rects,
+        # sloped shapes and arrow heads switch antialiasing on locally
+        painter = QPainter(image)
         painter.fillRect(self.rect(), QColor(255, 255, 255))
         
+        # dimension arrow heads are batched into one path, drawn on top at the end
+        self._arrow_path = QPainterPath()
+        self._arrow_path.setFillRule(Qt.WindingFill)
         if self.view_type == 'cross-section':
             self.draw_cross_section(painter)
         else:
             self.draw_top_view(painter)
+        self._flush_arrow_heads(painter)
+        painter.end()
+        return image
+
+    @staticmethod
+    def _pixel_rect(x, y, w, h):
+        """integer rect with rounded edges, so abutting fills neither gap nor overlap"""
+        left, top = round(x), round(y)
+        return QRect(left, top, round(x + w) - left, round(y + h) - top)
+
+    def _text_size(self, text, font, device=None):
+        """memoized (advance width, height, ascent) of text in font on a paint device"""
+        if device is None:
+            device = self
+        key = (font.key(), device.logicalDpiX(), device.logicalDpiY())
+        sizes = self._TEXT_SIZE_CACHE.get(key)
+        if sizes is None or len(sizes) > 1024:
+            sizes = self._TEXT_SIZE_CACHE[key] = {}
+            self._TEXT_METRICS[key] = QFontMetrics(font, device)
+        size = sizes.get(text)
+        if size is None:
+            metrics = self._TEXT_METRICS[key]
+            size = sizes[text] = (metrics.horizontalAdvance(text), metrics.height(), metrics.ascent())
+        return size
+
+    def _text_block(self, text, font, device):
+        """memoized (lines, widest advance, line height, ascent) of newline separated text"""
+        key = (text, font.key(), device.logicalDpiX(), device.logicalDpiY())
+        block = self._TEXT_BLOCK_CACHE.get(key)
+        if block is None:
+            if len(self._TEXT_BLOCK_CACHE) > 256:
+                self._TEXT_BLOCK_CACHE.clear()
+            lines = text.split('\n')
+            sizes = [self._text_size(line, font, device) for line in lines]
+            block = self._TEXT_BLOCK_CACHE[key] = (lines, max(size[0] for size in sizes),
+                                                   sizes[0][1], sizes[0][2])
+        return block
+
+    def _static_text(self, line):
+        """shared QStaticText of one text line, glyph layout kept between paints"""
+        static = self._STATIC_TEXT_CACHE.get(line)
+        if static is None:
+            if len(self._STATIC_TEXT_CACHE) > 256:
+                self._STATIC_TEXT_CACHE.clear()
+            static = self._STATIC_TEXT_CACHE[line] = QStaticText(line)
+            static.setTextFormat(Qt.PlainText)
+        return static
+
     def draw_text_with_background(self, painter, x, y, text,
                               bg_color=QColor(255, 255, 255, 230), 
                               text_color=QColor(0, 0, 0), font_size=7, bold=False):
 
-        font_weight = QFont.Bold if bold else QFont.Normal
-        font = QFont('Arial', font_size, font_weight)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-
+        device = painter.device()
+        dpr = device.devicePixelRatioF()
+
+        # the label is rendered once into a pixmap, later uses are a single blit;
+        # the font is only needed to render it, the target painter's font is left alone
+        key = (text, font_size, bold, bg_color.rgba(), text_color.rgba(), dpr)
+        label = self._label_pixmaps.get(key)
+        if label is None:
+            font = self._label_font(font_size, bold)
+            label = self._label_pixmaps[key] = self._render_label(font, device, dpr, text, bg_color, text_color)
+            if len(self._label_pixmaps) > self._LABEL_PIXMAP_LIMIT:
+                self._label_pixmaps.popitem(last=False)
+        else:
+            self._label_pixmaps.move_to_end(key)
+        pixmap, dx, dy = label
+        painter.drawPixmap(int(x) + dx, int(y) + dy, pixmap)
+
+    def _label_font(self, font_size, bold):
+        """shared Arial label font per (size, bold)"""
+        font = self._label_fonts.get((font_size, bold))
+        if font is None:
+            font = self._label_fonts[(font_size, bold)] = QFont('Arial', font_size,
+                                                               QFont.Bold if bold else QFont.Normal)
+        return font
+
+    def _render_label(self, font, device, dpr, text, bg_color, text_color):
+        """(pixmap, dx, dy) of a text label on its background box, offset from the text origin"""
         # breaking text in 2 to space be space
         lines = text.split("\n")
 
-        line_height = metrics.height()
-        max_width = max(metrics.boundingRect(line).width() for line in lines)
+        sizes = [self._text_size(line, font, device) for line in lines]
+        line_height = sizes[0][1]
+        ascent = sizes[0][2]
+        max_width = max(size[0] for size in sizes)
         total_height = line_height * len(lines)
 
         padding = 2
 
-        # background rectangle
-        bg_rect = QRectF(
-            x - padding,
-            y - total_height - padding,
-            max_width + 2 * padding,
-            total_height + 2 * padding
-        )
-
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(bg_color))
-        painter.drawRect(bg_rect)
+        # background box fills the whole pixmap
+        pixmap = QPixmap(int((max_width + 2 * padding) * dpr), int((total_height + 2 * padding) * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(bg_color)
 
         # Draw each text line
-        painter.setPen(QPen(text_color, 0.8))
-        first_line_y = y - total_height + metrics.ascent()
-
+        label_painter = QPainter(pixmap)
+        label_painter.setFont(font)
+        label_painter.setPen(QPen(text_color, 0.8))
         for i, line in enumerate(lines):
-            painter.drawText(int(x), int(first_line_y + i * line_height), line)
+            label_painter.drawText(padding, padding + ascent + i * line_height, line)
+        label_painter.end()
+        return pixmap, -padding, -total_height - padding
+
+    def _pooled_lines(self, *lines):
+        """pooled QLineFs set to the given (x1, y1, x2, y2) tuples, only valid until the next call"""
+        pool = self._line_pool
+        while len(pool) < len(lines):
+            pool.append(QLineF())
+        for line, coords in zip(pool, lines):
+            line.setLine(*coords)
+        return pool[:len(lines)]
+
+    def _draw_arrow_head(self, painter, head, x, y):
+        """fill one of the _ARROW_* heads with its tip moved to (x, y), antialiased;
+        while rendering the static layer the head is only collected, see _flush_arrow_heads"""
+        polygon = head.translated(x, y)
+        if self._arrow_path is not None:
+            self._arrow_path.addPolygon(polygon)
+            self._arrow_path.closeSubpath()
+            return
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPolygon(polygon)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+
+    def _flush_arrow_heads(self, painter):
+        """draw every collected dimension arrow head in one antialiased call"""
+        path, self._arrow_path = self._arrow_path, None
+        if path is None or path.isEmpty():
+            return
+        painter.setPen(self._PEN_BLACK)
+        painter.setBrush(self._BRUSH_BLACK)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPath(path)
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
-    
     def draw_dimension_arrow(self, painter, x1, y1, x2, y2, text, horizontal=True, offset=0, text_offset=0, draw_extensions=True, extension_direction='down', extension_end_y=None):
         """dimension line with arrows and text with extension lines"""
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.setPen(self._PEN_BLACK)
         
+        # dimension line and both end ticks in one call
         ext_len = 6
         if horizontal:
-            painter.drawLine(QPointF(x1, y1 - ext_len), QPointF(x1, y1 + ext_len))
-            painter.drawLine(QPointF(x2, y2 - ext_len), QPointF(x2, y2 + ext_len))
+            painter.drawLines(self._pooled_lines((x1, y1, x2, y2),
+                                                  (x1, y1 - ext_len, x1, y1 + ext_len),
+                                                  (x2, y2 - ext_len, x2, y2 + ext_len)))
         else:
-            painter.drawLine(QPointF(x1 - ext_len, y1), QPointF(x1 + ext_len, y1))
-            painter.drawLine(QPointF(x2 - ext_len, y2), QPointF(x2 + ext_len, y2))
+            painter.drawLines(self._pooled_lines((x1, y1, x2, y2),
+                                                  (x1 - ext_len, y1, x1 + ext_len, y1),
+                                                  (x2 - ext_len, y2, x2 + ext_len, y2)))
         
-        arrow_size = 4
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setBrush(self._BRUSH_BLACK)
         
         if horizontal:
-            left_arrow = [
-                QPointF(x1, y1),
-                QPointF(x1 + arrow_size, y1 - arrow_size/2),
-                QPointF(x1 + arrow_size, y1 + arrow_size/2)
-            ]
-            painter.drawPolygon(QPolygonF(left_arrow))
-            
-            right_arrow = [
-                QPointF(x2, y2),
-                QPointF(x2 - arrow_size, y2 - arrow_size/2),
-                QPointF(x2 - arrow_size, y2 + arrow_size/2)
-            ]
-            painter.drawPolygon(QPolygonF(right_arrow))
+            self._draw_arrow_head(painter, self._ARROW_H_LEFT, x1, y1)
+            
+            self._draw_arrow_head(painter, self._ARROW_H_RIGHT, x2, y2)
             
             if draw_extensions:
-                painter.setPen(QPen(QColor(100, 100, 100), 0.8, Qt.DotLine))
-                
+                # extension lines run to the given y, or a fixed length up or down
                 if extension_end_y is not None:
-                    # Draw extension lines to specified y coordinate
-                    if extension_direction == 'up':
-                        painter.drawLine(QPointF(x1, y1), QPointF(x1, extension_end_y))
-                        painter.drawLine(QPointF(x2, y2), QPointF(x2, extension_end_y))
-                    else:
-                        painter.drawLine(QPointF(x1, y1), QPointF(x1, extension_end_y))
-                        painter.drawLine(QPointF(x2, y2), QPointF(x2, extension_end_y))
+                    end_y1 = end_y2 = extension_end_y
                 else:
-                    extension_length = 40
-                    if extension_direction == 'up':
-                        painter.drawLine(QPointF(x1, y1), QPointF(x1, y1 - extension_length))
-                        painter.drawLine(QPointF(x2, y2), QPointF(x2, y2 - extension_length))
-                    else:
-                        painter.drawLine(QPointF(x1, y1), QPointF(x1, y1 + extension_length))
-                        painter.drawLine(QPointF(x2, y2), QPointF(x2, y2 + extension_length))
-                
-                painter.setPen(QPen(QColor(0, 0, 0), 0.8))
+                    extension_length = -40 if extension_direction == 'up' else 40
+                    end_y1, end_y2 = y1 + extension_length, y2 + extension_length
+                painter.setPen(self._PEN_DIM)
+                painter.drawLines(self._pooled_lines((x1, y1, x1, end_y1), (x2, y2, x2, end_y2)))
+                painter.setPen(self._PEN_BLACK)
             
             text_x = (x1 + x2) / 2
             text_y = y1 - 8 + text_offset if offset >= 0 else y1 + 15 + text_offset
             
-            font = QFont('Arial', 7, QFont.Bold)
-            metrics = painter.fontMetrics()
-            text_width = metrics.boundingRect(text).width()
+            text_width, _, _ = self._text_size(text, self._font_label, painter.device())
             
             self.draw_text_with_background(painter, text_x - text_width/2, text_y, text, 
-                                        QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                        self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
         else:
-            top_arrow = [
-                QPointF(x1, y1),
-                QPointF(x1 - arrow_size/2, y1 + arrow_size),
-                QPointF(x1 + arrow_size/2, y1 + arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(top_arrow))
-            
-            bottom_arrow = [
-                QPointF(x2, y2),
-                QPointF(x2 - arrow_size/2, y2 - arrow_size),
-                QPointF(x2 + arrow_size/2, y2 - arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(bottom_arrow))
+            self._draw_arrow_head(painter, self._ARROW_V_TOP, x1, y1)
+            
+            self._draw_arrow_head(painter, self._ARROW_V_BOTTOM, x2, y2)
             
             if draw_extensions:
-                painter.setPen(QPen(QColor(100, 100, 100), 0.8, Qt.DotLine))
+                painter.setPen(self._PEN_DIM)
                 extension_length = 20
                 
                 if extension_direction == 'left':
-                    painter.drawLine(QPointF(x1, y1), QPointF(x1 - extension_length, y1))
-                    painter.drawLine(QPointF(x2, y2), QPointF(x2 - extension_length, y2))
+                    painter.drawLines(self._pooled_lines((x1, y1, x1 - extension_length, y1),
+                                                          (x2, y2, x2 - extension_length, y2)))
                 else:
-                    painter.drawLine(QPointF(x1, y1), QPointF(x1 + extension_length, y1))
-                    painter.drawLine(QPointF(x2, y2), QPointF(x2 + extension_length, y2))
+                    painter.drawLines(self._pooled_lines((x1, y1, x1 + extension_length, y1),
+                                                          (x2, y2, x2 + extension_length, y2)))
                 
-                painter.setPen(QPen(QColor(0, 0, 0), 0.8))
+                painter.setPen(self._PEN_BLACK)
             
             text_x = x1 + (12 if offset >= 0 else -45) + text_offset
             text_y = (y1 + y2) / 2 + 3
             
             self.draw_text_with_background(painter, text_x, text_y, text,
-                                        QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                        self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
     
     def draw_dimension_arrow_text_outside(self, painter, x1, y1, x2, y2, text, horizontal=True, 
                                           text_side='right', text_offset=15):
         """Dimension line with arrows"""
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+        painter.setPen(self._PEN_BLACK)
         
         ext_len = 6
-        arrow_size = 4
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setBrush(self._BRUSH_BLACK)
         
         if horizontal:
-            painter.drawLine(QPointF(x1, y1 - ext_len), QPointF(x1, y1 + ext_len))
-            painter.drawLine(QPointF(x2, y2 - ext_len), QPointF(x2, y2 + ext_len))
-            
-            left_arrow = [
-                QPointF(x1, y1),
-                QPointF(x1 + arrow_size, y1 - arrow_size/2),
-                QPointF(x1 + arrow_size, y1 + arrow_size/2)
-            ]
-            painter.drawPolygon(QPolygonF(left_arrow))
-            
-            right_arrow = [
-                QPointF(x2, y2),
-                QPointF(x2 - arrow_size, y2 - arrow_size/2),
-                QPointF(x2 - arrow_size, y2 + arrow_size/2)
-            ]
-            painter.drawPolygon(QPolygonF(right_arrow))
+            painter.drawLines(self._pooled_lines((x1, y1, x2, y2),
+                                                  (x1, y1 - ext_len, x1, y1 + ext_len),
+                                                  (x2, y2 - ext_len, x2, y2 + ext_len)))
+            
+            self._draw_arrow_head(painter, self._ARROW_H_LEFT, x1, y1)
+            
+            self._draw_arrow_head(painter, self._ARROW_H_RIGHT, x2, y2)
             
             if text_side == 'top':
                 text_x = (x1 + x2) / 2
@@ -323,30 +662,18 @@ class BridgeCADWidget(QWidget):
                 text_x = (x1 + x2) / 2
                 text_y = y1 + text_offset + 10
                 
-            font = QFont('Arial', 7, QFont.Bold)
-            painter.setFont(font)
-            metrics = painter.fontMetrics()
-            text_width = metrics.boundingRect(text).width()
+            text_width, _, _ = self._text_size(text, self._font_label, painter.device())
             
             self.draw_text_with_background(painter, text_x - text_width/2, text_y, text, 
-                                        QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                        self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
         else:
-            painter.drawLine(QPointF(x1 - ext_len, y1), QPointF(x1 + ext_len, y1))
-            painter.drawLine(QPointF(x2 - ext_len, y2), QPointF(x2 + ext_len, y2))
-            
-            top_arrow = [
-                QPointF(x1, y1),
-                QPointF(x1 - arrow_size/2, y1 + arrow_size),
-                QPointF(x1 + arrow_size/2, y1 + arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(top_arrow))
-            
-            bottom_arrow = [
-                QPointF(x2, y2),
-                QPointF(x2 - arrow_size/2, y2 - arrow_size),
-                QPointF(x2 + arrow_size/2, y2 - arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(bottom_arrow))
+            painter.drawLines(self._pooled_lines((x1, y1, x2, y2),
+                                                  (x1 - ext_len, y1, x1 + ext_len, y1),
+                                                  (x2 - ext_len, y2, x2 + ext_len, y2)))
+            
+            self._draw_arrow_head(painter, self._ARROW_V_TOP, x1, y1)
+            
+            self._draw_arrow_head(painter, self._ARROW_V_BOTTOM, x2, y2)
             
             text_y = (y1 + y2) / 2 + 3
             if text_side == 'left':
@@ -355,26 +682,33 @@ class BridgeCADWidget(QWidget):
                 text_x = x1 + text_offset
             
             self.draw_text_with_background(painter, text_x, text_y, text,
-                                        QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                        self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
         
     def draw_leader_arrow(self, painter, from_x, from_y, to_x, to_y, text, bg_color=QColor(255, 255, 255, 250), text_color=QColor(0, 0, 0)):
         """a leader line with arrow pointing to component"""
-        painter.setPen(QPen(QColor(0, 0, 0), 1.0))
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self._PEN_LEADER)
         painter.drawLine(QPointF(from_x, from_y), QPointF(to_x, to_y))
         
+        # barbs are the unit direction rotated by +-30 degrees, no trig per arrow
         arrow_size = 5
-        angle = math.atan2(to_y - from_y, to_x - from_x)
+        dx = to_x - from_x
+        dy = to_y - from_y
+        length = math.hypot(dx, dy)
+        ux, uy = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+        cos30, sin30 = self._LEADER_BARB_COS, self._LEADER_BARB_SIN
         
         arrow_points = [
             QPointF(to_x, to_y),
-            QPointF(to_x - arrow_size * math.cos(angle - math.pi/6), 
-                   to_y - arrow_size * math.sin(angle - math.pi/6)),
-            QPointF(to_x - arrow_size * math.cos(angle + math.pi/6), 
-                   to_y - arrow_size * math.sin(angle + math.pi/6))
+            QPointF(to_x - arrow_size * (ux * cos30 + uy * sin30),
+                   to_y - arrow_size * (uy * cos30 - ux * sin30)),
+            QPointF(to_x - arrow_size * (ux * cos30 - uy * sin30),
+                   to_y - arrow_size * (uy * cos30 + ux * sin30))
         ]
         
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setBrush(self._BRUSH_BLACK)
         painter.drawPolygon(QPolygonF(arrow_points))
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
         self.draw_text_with_background(painter, from_x - 5, from_y - 5, text, bg_color, text_color, 7, True)
     
@@ -382,6 +716,7 @@ class BridgeCADWidget(QWidget):
                                 text_color=QColor(0, 0, 0), line_color=QColor(100, 100, 100)):
         """draw a clean leader line from target point to label with dotted line"""
         # Draw dotted line from target to label
+        painter.setRenderHint(QPainter.Antialiasing, True)
         pen = QPen(line_color, 1.0, Qt.DotLine)
         painter.setPen(pen)
         painter.drawLine(QPointF(target_x, target_y), QPointF(label_x, label_y))
@@ -390,13 +725,10 @@ class BridgeCADWidget(QWidget):
         painter.setPen(QPen(line_color, 1.5))
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(QPointF(target_x, target_y), 3, 3)
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
         # Draw text at label position
-        font = QFont('Arial', 7, QFont.Bold)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_width = metrics.boundingRect(text).width()
-        text_height = metrics.height()
+        text_width, text_height, _ = self._text_size(text, self._font_label, painter.device())
         
         # Determine text alignment based on relative position
         if label_x > target_x:
@@ -408,16 +740,22 @@ class BridgeCADWidget(QWidget):
         
         # Draw text with background
         self.draw_text_with_background(painter, text_x, text_y, text,
-                                       QColor(255, 255, 255, 240), text_color, 7, True)
+                                       self._COLOR_LABEL_BG, text_color, 7, True)
     
     def compute_deck_total_width(self):
         """Compute total deck width including median if present"""
-        carriageway = self.params.get('carriageway_width', 10500)
-        crash_barrier = self.params.get('crash_barrier_width', 500)
-        footpath_width = self.params.get('footpath_width', 1500)
-        fp_config = self.params.get('footpath_config', 'both')
-        median_present = self.params.get('median_present', False)
-        median_width = self.params.get('median_width', 1200)
+        p = self.params
+        key = (p['carriageway_width'], p['crash_barrier_width'], p['footpath_width'],
+               p['footpath_config'], p['median_present'], p['median_width'])
+        if key == self._deck_geom_key:
+            return self._deck_geom_cache
+        
+        carriageway = self.params['carriageway_width']
+        crash_barrier = self.params['crash_barrier_width']
+        footpath_width = self.params['footpath_width']
+        fp_config = self.params['footpath_config']
+        median_present = self.params['median_present']
+        median_width = self.params['median_width']
         
         if fp_config == 'both':
             num_fp = 2
@@ -437,6 +775,8 @@ class BridgeCADWidget(QWidget):
                           2 * crash_barrier + 
                           num_fp * footpath_width)
         
+        self._deck_geom_key = key
+        self._deck_geom_cache = (deck_total, num_fp)
         return deck_total, num_fp
 
     def draw_median_crash_barriers(self, painter, median_start_x, median_end_x, deck_top_y, scale):
@@ -483,29 +823,11 @@ class BridgeCADWidget(QWidget):
         left_at_top = 50 * scale * scale_ratio
         right_at_top = 225 * scale * scale_ratio
         
-        # LEFT barrier - front faces LEFT (toward left carriageway)
-        # This is the mirrored version
-        x_left = median_start_x
-        
-        points_left = [
-            QPointF(x_left, y),                                      # bottom-left
-            QPointF(x_left + bottom_w, y),                           # bottom-right
-            QPointF(x_left + bottom_w, y_base_top),                  # right after base
-            QPointF(x_left + bottom_w - left_at_top, y_top),         # top-right
-            QPointF(x_left + bottom_w - right_at_top, y_top),        # top-left
-            QPointF(x_left + bottom_w - right_at_mid, y_mid),        # left at middle
-            QPointF(x_left, y_base_top),                             # left after base
-        ]
-        
-        painter.setBrush(QBrush(QColor(255, 210, 160)))
-        painter.setPen(QPen(QColor(0, 0, 0), max(1.5, scale * 1.5)))
-        painter.drawPolygon(QPolygonF(points_left))
-        
         # RIGHT barrier - front faces RIGHT (toward right carriageway)
         # This is the original orientation
         x_right = median_end_x - bottom_w
         
-        points_right = [
+        profile = QPolygonF([
             QPointF(x_right, y),                           # bottom-left
             QPointF(x_right + bottom_w, y),                # bottom-right
             QPointF(x_right + bottom_w, y_base_top),       # right after base
@@ -513,23 +835,24 @@ class BridgeCADWidget(QWidget):
             QPointF(x_right + right_at_top, y_top),        # top-right
             QPointF(x_right + left_at_top, y_top),         # top-left
             QPointF(x_right, y_base_top),                  # left after base
-        ]
+        ])
         
-        painter.setBrush(QBrush(QColor(255, 210, 160)))
+        painter.setBrush(self._BRUSH_BARRIER)
         painter.setPen(QPen(QColor(0, 0, 0), max(1.5, scale * 1.5)))
-        painter.drawPolygon(QPolygonF(points_right))
-
-    def draw_cross_section(self, painter):
-        """Draw cross-section with median support and hover highlighting"""
-        GIRDER_COLOR = QColor(40, 40, 40)
-        STIFFENER_COLOR = QColor(180, 230, 180)
-        CROSS_BRACING_COLOR = QColor(255, 140, 0)
-        MEDIAN_COLOR = QColor(255, 200, 100)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPolygon(profile)
         
+        # LEFT barrier - front faces LEFT (toward left carriageway)
+        # the same profile mirrored about the median centre line
+        painter.drawPolygon(QTransform(-1, 0, 0, 1, median_start_x + median_end_x, 0).map(profile))
+        painter.setRenderHint(QPainter.Antialiasing, False)
+
+    def _cross_section_layout(self):
+        """pure cross-section geometry in widget pixels, shared by drawing and hover hit-testing"""
         width = self.width()
         height = self.height()
 
-        fp_config = self.params.get('footpath_config', 'both')
+        fp_config = self.params['footpath_config']
         left_fp_width = self.params['footpath_width'] if fp_config in ['left', 'both'] else 0
         right_fp_width = self.params['footpath_width'] if fp_config in ['right', 'both'] else 0
 
@@ -544,13 +867,8 @@ class BridgeCADWidget(QWidget):
         center_x = width / 2
         base_y = height - margin - 240
 
-        painter.setFont(QFont('Arial', 11, QFont.Bold))
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        title_text = "CROSS-SECTION VIEW"
-        self.draw_text_with_background(painter, 30, 35, title_text, 
-                                    QColor(230, 240, 255, 250), QColor(0, 0, 100), 11, True)
-
-        girder_depth_visual = self.girder['depth'] * scale * self.girder_visual_scale['depth']
+        girder_px = self._girder_px(scale)
+        girder_depth_visual = girder_px['depth']
         girder_top_y = base_y - girder_depth_visual
         deck_thick_px = self.params['deck_thickness'] * scale
         fp_thick_px = self.params['footpath_thickness'] * scale
@@ -587,8 +905,8 @@ class BridgeCADWidget(QWidget):
         carriageway_start_x = left_barrier_end_x
         carriageway_end_x = right_barrier_x
         
-        median_present = self.params.get('median_present', False)
-        median_width = self.params.get('median_width', 1200)
+        median_present = self.params['median_present']
+        median_width = self.params['median_width']
         
         if median_present:
             cw_full = self.params['carriageway_width']
@@ -605,120 +923,154 @@ class BridgeCADWidget(QWidget):
             carriageway_start_x = cw1_start_x
             carriageway_end_x = cw2_end_x
         else:
+            cw1_start_x = cw1_end_x = cw2_start_x = cw2_end_x = None
             median_start_x = None
             median_end_x = None
 
         n = max(1, int(self.params['num_girders']))
-        deck_overhang_px = self.params.get('deck_overhang', 1000) * scale
+        deck_overhang_px = self.params['deck_overhang'] * scale
+        
+        # girder centres, kept clear of the deck edges by half a flange
+        flange_half_px = girder_px['flange_width'] / 2.0
+        min_allowed_x = deck_left_x + flange_half_px + 1
+        max_allowed_x = deck_right_x - flange_half_px - 1
         
         if n > 1:
             first_girder_x = deck_left_x + deck_overhang_px
             last_girder_x = deck_right_x - deck_overhang_px
-            available_for_spacing = last_girder_x - first_girder_x
-            actual_spacing_px = available_for_spacing / (n - 1) if n > 1 else 0
-            positions = [first_girder_x + i * actual_spacing_px for i in range(n)]
+            actual_spacing_px = (last_girder_x - first_girder_x) / (n - 1)
+            positions = [max(min_allowed_x, min(max_allowed_x, first_girder_x + i * actual_spacing_px))
+                         for i in range(n)]
         else:
-            positions = [center_x]
+            positions = [max(min_allowed_x, min(max_allowed_x, center_x))]
 
-        flange_half_px = (self.girder['flange_width'] * scale * self.girder_visual_scale['flange_width']) / 2.0
-        min_allowed_x = deck_left_x + flange_half_px + 1
-        max_allowed_x = deck_right_x - flange_half_px - 1
-        positions = [max(min_allowed_x, min(max_allowed_x, p)) for p in positions]
-
-        RAILING_OUTER_WIDTH_MM = 375
-        railing_outer_width_px = RAILING_OUTER_WIDTH_MM * scale
+        railing_outer_width_px = self.RAILING_OUTER_WIDTH_MM * scale
         railing_width_px = railing_outer_width_px
 
-        # Draw deck slab
         deck_slab_left = left_barrier_x
         deck_slab_right = right_barrier_end_x
+
+        # railing posts stand on the outer footpath edges, (x, top, right, bottom, width)
+        # matching what draw_railing_post_fixed returns
+        railing_w = max(4, self.RAILING_OUTER_WIDTH_MM * scale)
+        railing_top_y = fp_top_y - self._RAILING_HEIGHT_MM * scale
+        left_railing_rect = None
+        right_railing_rect = None
+        if fp_config in ['left', 'both'] and left_fp_width > 0:
+            left_railing_rect = (deck_left_x, railing_top_y, deck_left_x + railing_w, fp_top_y, railing_w)
+        if fp_config in ['right', 'both'] and right_fp_width > 0:
+            railing_x = deck_right_x - railing_outer_width_px
+            right_railing_rect = (railing_x, railing_top_y, railing_x + railing_w, fp_top_y, railing_w)
+
+        return {
+            'fp_config': fp_config, 'left_fp_width': left_fp_width, 'right_fp_width': right_fp_width,
+            'scale': scale, 'base_y': base_y, 'n': n, 'positions': positions, 'girder_px': girder_px,
+            'girder_depth_visual': girder_depth_visual,
+            'deck_thick_px': deck_thick_px, 'fp_thick_px': fp_thick_px,
+            'deck_top_y': deck_top_y, 'deck_bottom_y': deck_bottom_y, 'fp_top_y': fp_top_y,
+            'deck_left_x': deck_left_x, 'deck_right_x': deck_right_x,
+            'deck_slab_left': deck_slab_left, 'deck_slab_right': deck_slab_right,
+            'crash_barrier_width_px': crash_barrier_width_px,
+            'left_fp_width_px': left_fp_width_px, 'right_fp_width_px': right_fp_width_px,
+            'left_fp_x': left_fp_x, 'right_fp_x': right_fp_x,
+            'left_barrier_x': left_barrier_x, 'left_barrier_end_x': left_barrier_end_x,
+            'right_barrier_x': right_barrier_x, 'right_barrier_end_x': right_barrier_end_x,
+            'carriageway_start_x': carriageway_start_x, 'carriageway_end_x': carriageway_end_x,
+            'median_present': median_present, 'median_width': median_width,
+            'median_start_x': median_start_x, 'median_end_x': median_end_x,
+            'cw1_start_x': cw1_start_x, 'cw1_end_x': cw1_end_x,
+            'cw2_start_x': cw2_start_x, 'cw2_end_x': cw2_end_x,
+            'railing_outer_width_px': railing_outer_width_px, 'railing_width_px': railing_width_px,
+            'left_railing_rect': left_railing_rect, 'right_railing_rect': right_railing_rect,
+        }
+
+    def draw_cross_section(self, painter):
+        """Draw cross-section with median support and hover highlighting"""
+        GIRDER_COLOR = QColor(40, 40, 40)
+        STIFFENER_COLOR = QColor(180, 230, 180)
+        MEDIAN_COLOR = QColor(255, 200, 100)
         
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
+        g = self._cross_section_layout()
+        fp_config, left_fp_width, right_fp_width = g['fp_config'], g['left_fp_width'], g['right_fp_width']
+        scale, base_y, n, positions = g['scale'], g['base_y'], g['n'], g['positions']
+        girder_depth_visual, deck_thick_px, fp_thick_px = g['girder_depth_visual'], g['deck_thick_px'], g['fp_thick_px']
+        deck_top_y, deck_bottom_y, fp_top_y = g['deck_top_y'], g['deck_bottom_y'], g['fp_top_y']
+        deck_left_x, deck_right_x = g['deck_left_x'], g['deck_right_x']
+        deck_slab_left, deck_slab_right = g['deck_slab_left'], g['deck_slab_right']
+        crash_barrier_width_px = g['crash_barrier_width_px']
+        left_fp_width_px, right_fp_width_px = g['left_fp_width_px'], g['right_fp_width_px']
+        left_fp_x, right_fp_x = g['left_fp_x'], g['right_fp_x']
+        left_barrier_x, left_barrier_end_x = g['left_barrier_x'], g['left_barrier_end_x']
+        right_barrier_x, right_barrier_end_x = g['right_barrier_x'], g['right_barrier_end_x']
+        carriageway_start_x, carriageway_end_x = g['carriageway_start_x'], g['carriageway_end_x']
+        median_present, median_width = g['median_present'], g['median_width']
+        median_start_x, median_end_x = g['median_start_x'], g['median_end_x']
+        cw1_start_x, cw1_end_x = g['cw1_start_x'], g['cw1_end_x']
+        cw2_start_x, cw2_end_x = g['cw2_start_x'], g['cw2_end_x']
+        railing_outer_width_px, railing_width_px = g['railing_outer_width_px'], g['railing_width_px']
+        girder_px = g['girder_px']
+
+        title_text = "CROSS-SECTION VIEW"
+        self.draw_text_with_background(painter, 30, 35, title_text, 
+                                    QColor(230, 240, 255, 250), QColor(0, 0, 100), 11, True)
+
+        # Draw deck slab
+        painter.setPen(self._PEN_OUTLINE)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(QRectF(deck_slab_left, deck_top_y,
                             deck_slab_right - deck_slab_left, deck_thick_px))
 
+        # carriageway and crash barrier deck zones share one fill, the median sits between them
+        gray_rects = [self._pixel_rect(left_barrier_x, deck_top_y, crash_barrier_width_px, deck_thick_px),
+                      self._pixel_rect(right_barrier_x, deck_top_y, crash_barrier_width_px, deck_thick_px)]
         if median_present:
-            painter.setBrush(QBrush(QColor(200, 200, 200)))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(QRectF(cw1_start_x, deck_top_y,
-                                cw1_end_x - cw1_start_x, deck_thick_px))
-            painter.drawRect(QRectF(cw2_start_x, deck_top_y,
-                                cw2_end_x - cw2_start_x, deck_thick_px))
-            painter.setBrush(QBrush(MEDIAN_COLOR))
-            painter.drawRect(QRectF(median_start_x, deck_top_y,
-                                median_end_x - median_start_x, deck_thick_px))
+            gray_rects.append(self._pixel_rect(cw1_start_x, deck_top_y,
+                                               cw1_end_x - cw1_start_x, deck_thick_px))
+            gray_rects.append(self._pixel_rect(cw2_start_x, deck_top_y,
+                                               cw2_end_x - cw2_start_x, deck_thick_px))
         else:
-            painter.setBrush(QBrush(QColor(200, 200, 200)))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(QRectF(carriageway_start_x, deck_top_y,
-                                carriageway_end_x - carriageway_start_x, deck_thick_px))
-
-        # Crash barrier deck zones
-        painter.setBrush(QBrush(QColor(200, 200, 200)))
-        painter.drawRect(QRectF(left_barrier_x, deck_top_y,
-                                crash_barrier_width_px, deck_thick_px))
-        painter.drawRect(QRectF(right_barrier_x, deck_top_y,
-                                crash_barrier_width_px, deck_thick_px))
-
-        # footpath to deck connecting line
-        dashed_pen = QPen(QColor(0, 0, 0), 1.5, Qt.DashLine)
-        dashed_pen.setDashPattern([2, 2])  # Tiny dashes
-
-        # making the line dashed
-        if fp_config in ['left', 'both'] and left_fp_width > 0:
-            # Draw footpath fill only (no border)
-            painter.setBrush(QBrush(QColor(220, 220, 220)))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(QRectF(left_fp_x, fp_top_y,
-                                left_fp_width_px, fp_thick_px))
-            
-            # Draw horizontal edges as solid
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
+            gray_rects.append(self._pixel_rect(carriageway_start_x, deck_top_y,
+                                               carriageway_end_x - carriageway_start_x, deck_thick_px))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._BRUSH_DECK)
+        painter.drawRects(gray_rects)
+        if median_present:
+            painter.setBrush(MEDIAN_COLOR)
+            painter.drawRect(self._pixel_rect(median_start_x, deck_top_y,
+                                              median_end_x - median_start_x, deck_thick_px))
+
+        # footpaths: fills first, then solid edges, then the dashed edges joining the deck,
+        # each bucket with one pen
+        left_fp = fp_config in ['left', 'both'] and left_fp_width > 0
+        right_fp = fp_config in ['right', 'both'] and right_fp_width > 0
+        fp_bottom_y = fp_top_y + fp_thick_px
+        fp_rects = []
+        solid_lines = []
+        dashed_lines = []
+        if left_fp:
+            left_fp_end_x = left_fp_x + left_fp_width_px
+            fp_rects.append(self._pixel_rect(left_fp_x, fp_top_y, left_fp_width_px, fp_thick_px))
+            # top, bottom and outer edges solid, inner edge dashed
+            solid_lines += [QLineF(left_fp_x, fp_top_y, left_fp_end_x, fp_top_y),
+                            QLineF(left_fp_x, fp_bottom_y, left_fp_end_x, fp_bottom_y),
+                            QLineF(left_fp_x, fp_top_y, left_fp_x, fp_bottom_y)]
+            dashed_lines.append(QLineF(left_fp_end_x, fp_top_y, left_fp_end_x, fp_bottom_y))
+        if right_fp:
+            right_fp_end_x = right_fp_x + right_fp_width_px
+            fp_rects.append(self._pixel_rect(right_fp_x, fp_top_y, right_fp_width_px, fp_thick_px))
+            solid_lines += [QLineF(right_fp_x, fp_top_y, right_fp_end_x, fp_top_y),
+                            QLineF(right_fp_x, fp_bottom_y, right_fp_end_x, fp_bottom_y),
+                            QLineF(right_fp_end_x, fp_top_y, right_fp_end_x, fp_bottom_y)]
+            dashed_lines.append(QLineF(right_fp_x, fp_top_y, right_fp_x, fp_bottom_y))
+
+        if fp_rects:
+            painter.setBrush(self._BRUSH_FOOTPATH)
+            painter.drawRects(fp_rects)
             painter.setBrush(Qt.NoBrush)
-            # Top edge
-            painter.drawLine(QPointF(left_fp_x, fp_top_y), 
-                            QPointF(left_fp_x + left_fp_width_px, fp_top_y))
-            # Bottom edge
-            painter.drawLine(QPointF(left_fp_x, fp_top_y + fp_thick_px), 
-                            QPointF(left_fp_x + left_fp_width_px, fp_top_y + fp_thick_px))
-            
-            # Left edge 
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            painter.drawLine(QPointF(left_fp_x, fp_top_y), 
-                            QPointF(left_fp_x, fp_top_y + fp_thick_px))
-            
-            # Right edge
-            painter.setPen(dashed_pen)
-            painter.drawLine(QPointF(left_fp_x + left_fp_width_px, fp_top_y), 
-                            QPointF(left_fp_x + left_fp_width_px, fp_top_y + fp_thick_px))
+            painter.setPen(self._PEN_OUTLINE)
+            painter.drawLines(solid_lines)
+        # the dashed inner edges wait for the other dashed deck lines below
 
-        if fp_config in ['right', 'both'] and right_fp_width > 0:
-            # Draw footpath fill
-            painter.setBrush(QBrush(QColor(220, 220, 220)))
-            painter.setPen(Qt.NoPen)
-            painter.drawRect(QRectF(right_fp_x, fp_top_y,
-                                right_fp_width_px, fp_thick_px))
-            
-            # Draw horizontal edges as solid
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            painter.setBrush(Qt.NoBrush)
-            # Top edge
-            painter.drawLine(QPointF(right_fp_x, fp_top_y), 
-                            QPointF(right_fp_x + right_fp_width_px, fp_top_y))
-            # Bottom edge
-            painter.drawLine(QPointF(right_fp_x, fp_top_y + fp_thick_px), 
-                            QPointF(right_fp_x + right_fp_width_px, fp_top_y + fp_thick_px))
-            
-            # Left edge (inner edge connecting to deck) - DASHED
-            painter.setPen(dashed_pen)
-            painter.drawLine(QPointF(right_fp_x, fp_top_y), 
-                            QPointF(right_fp_x, fp_top_y + fp_thick_px))
-            
-            # Right edge (outer edge where railing sits) - SOLID
-            painter.setPen(QPen(QColor(0, 0, 0), 2))
-            painter.drawLine(QPointF(right_fp_x + right_fp_width_px, fp_top_y), 
-                            QPointF(right_fp_x + right_fp_width_px, fp_top_y + fp_thick_px))
         # Draw crash barriers
         cb_y = deck_top_y
         # Left barrier: x is where it STARTS (left edge)
@@ -730,95 +1082,62 @@ class BridgeCADWidget(QWidget):
             self.draw_median_crash_barriers(painter, median_start_x, median_end_x, deck_top_y, scale)
 
         # Draw the main deck bottom line solid (only the deck slab portion)
-        painter.setPen(QPen(QColor(0, 0, 0), 1.5))
+        painter.setPen(self._PEN_THIN)
         painter.drawLine(QPointF(deck_slab_left, deck_bottom_y), 
                         QPointF(deck_slab_right, deck_bottom_y))
 
-        # Draw dashed lines for footpath area bottom and vertical connections
-        # Left footpath area
-        if fp_config in ['left', 'both'] and left_fp_width > 0:
-            painter.setPen(dashed_pen)
-            # Bottom line under footpath area (dashed)
-            painter.drawLine(QPointF(deck_left_x, deck_bottom_y), 
-                            QPointF(deck_slab_left, deck_bottom_y))
-            # Outer vertical line from footpath bottom to deck bottom level (dashed)
-            painter.drawLine(QPointF(deck_left_x, fp_top_y + fp_thick_px), 
-                            QPointF(deck_left_x, deck_bottom_y))
-
-        # Right footpath area
-        if fp_config in ['right', 'both'] and right_fp_width > 0:
-            painter.setPen(dashed_pen)
-            # Bottom line under footpath area (dashed)
-            painter.drawLine(QPointF(deck_slab_right, deck_bottom_y), 
-                            QPointF(deck_right_x, deck_bottom_y))
-            # Outer vertical line from footpath bottom to deck bottom level (dashed)
-            painter.drawLine(QPointF(deck_right_x, fp_top_y + fp_thick_px), 
-                            QPointF(deck_right_x, deck_bottom_y))
-
-        # Draw cross bracing between girders
+        # Draw dashed lines for footpath area bottom and vertical connections:
+        # the deck bottom under each footpath and its outer vertical down to it,
+        # together with the footpath inner edges in one dashed pass
+        if left_fp:
+            dashed_lines += [QLineF(deck_left_x, deck_bottom_y, deck_slab_left, deck_bottom_y),
+                             QLineF(deck_left_x, fp_bottom_y, deck_left_x, deck_bottom_y)]
+        if right_fp:
+            dashed_lines += [QLineF(deck_slab_right, deck_bottom_y, deck_right_x, deck_bottom_y),
+                             QLineF(deck_right_x, fp_bottom_y, deck_right_x, deck_bottom_y)]
+        if dashed_lines:
+            painter.setPen(self._PEN_DASHED_JOIN)
+            painter.drawLines(dashed_lines)
+
+        # Draw cross bracing between girders: all panel fills in one call, then every
+        # diagonal pair collected into one path and stroked once
         if n > 1:
             girder_top_edge = base_y - girder_depth_visual
             girder_bottom_edge = base_y
+            line_spacing = 3
             
-            for i in range(n - 1):
-                x1 = positions[i]
-                x2 = positions[i + 1]
-                
-                panel_points = [
-                    QPointF(x1, girder_top_edge),
-                    QPointF(x2, girder_top_edge),
-                    QPointF(x2, girder_bottom_edge),
-                    QPointF(x1, girder_bottom_edge)
-                ]
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(QColor(255, 240, 220, 100)))
-                painter.drawPolygon(QPolygonF(panel_points))
-                
-                line_spacing = 3
-                painter.setBrush(Qt.NoBrush)
-                painter.setPen(QPen(CROSS_BRACING_COLOR, 1.0))
-                
-                dx = x2 - x1
-                dy = girder_bottom_edge - girder_top_edge
-                length = math.sqrt(dx * dx + dy * dy)
-                
-                if length > 0:
-                    perp_x = -dy / length
-                    perp_y = dx / length
-                    off_x = perp_x * line_spacing / 2
-                    off_y = perp_y * line_spacing / 2
-                    
-                    painter.drawLine(QPointF(x1 + off_x, girder_top_edge + off_y), 
-                                    QPointF(x2 + off_x, girder_bottom_edge + off_y))
-                    painter.drawLine(QPointF(x1 - off_x, girder_top_edge - off_y), 
-                                    QPointF(x2 - off_x, girder_bottom_edge - off_y))
-                    
-                    perp_x2 = dy / length
-                    perp_y2 = dx / length
-                    off_x2 = perp_x2 * line_spacing / 2
-                    off_y2 = perp_y2 * line_spacing / 2
-                    
-                    painter.drawLine(QPointF(x2 + off_x2, girder_top_edge + off_y2), 
-                                    QPointF(x1 + off_x2, girder_bottom_edge + off_y2))
-                    painter.drawLine(QPointF(x2 - off_x2, girder_top_edge - off_y2), 
-                                    QPointF(x1 - off_x2, girder_bottom_edge - off_y2))
+            panel_depth = girder_bottom_edge - girder_top_edge
+            panel_rects = [QRectF(x1, girder_top_edge, x2 - x1, panel_depth).normalized()
+                           for x1, x2 in zip(positions, positions[1:])]
+            diag_path = QPainterPath()
+            for x1, y1, x2, y2 in self._bracing_segments(positions, girder_top_edge,
+                                                         girder_bottom_edge, line_spacing):
+                diag_path.moveTo(x1, y1)
+                diag_path.lineTo(x2, y2)
+            
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._BRUSH_BRACING_PANEL)
+            painter.drawRects(panel_rects)
+            
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(self._PEN_BRACING)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.drawPath(diag_path)
+            painter.setRenderHint(QPainter.Antialiasing, False)
                     
         # Draw girders and stiffeners
         for girder_x in positions:
-            self.draw_i_section(painter, girder_x, base_y, scale, GIRDER_COLOR)
-            self.draw_stiffeners(painter, girder_x, base_y, scale, STIFFENER_COLOR)
+            self.draw_i_section(painter, girder_x, base_y, scale, GIRDER_COLOR, girder_px)
+            self.draw_stiffeners(painter, girder_x, base_y, scale, STIFFENER_COLOR, girder_px)
 
         # Draw railings
-        left_railing_rect = None
-        right_railing_rect = None
-
         if fp_config in ['left', 'both'] and left_fp_width > 0:
             railing_x = deck_left_x
-            left_railing_rect = self.draw_railing_post_fixed(painter, railing_x, fp_top_y, scale, "left")
+            self.draw_railing_post_fixed(painter, railing_x, fp_top_y, scale, "left")
             
         if fp_config in ['right', 'both'] and right_fp_width > 0:
             railing_x = deck_right_x - railing_outer_width_px
-            right_railing_rect = self.draw_railing_post_fixed(painter, railing_x, fp_top_y, scale, "right")
+            self.draw_railing_post_fixed(painter, railing_x, fp_top_y, scale, "right")
 
         # Add dimensions
         self.add_professional_cross_section_dimensions(
@@ -830,18 +1149,6 @@ class BridgeCADWidget(QWidget):
             crash_barrier_width_px, left_barrier_end_x, right_barrier_end_x
         )
 
-        # Add hover labels
-        self.add_cross_section_hover_labels(
-            painter, carriageway_start_x, carriageway_end_x, left_barrier_x, right_barrier_x,
-            deck_top_y, deck_bottom_y, deck_thick_px, positions, base_y, scale, n, fp_config,
-            deck_left_x, deck_right_x, left_fp_width, right_fp_width, fp_top_y, fp_thick_px,
-            left_fp_x, right_fp_x, left_railing_rect, right_railing_rect, railing_width_px,
-            median_present, median_start_x, median_end_x, median_width, deck_slab_left, deck_slab_right,
-            crash_barrier_width_px, left_barrier_end_x, right_barrier_end_x
-        )
-
-
-
     def draw_railing_post_fixed(self, painter, x, y, scale, side):
         """Draw RCC railing with exact dimensions:
         - Height: 1100 mm
@@ -849,8 +1156,31 @@ class BridgeCADWidget(QWidget):
         - Inner spacing: 275 mm
         - Base thickness: 100 mm
         """
-        RAILING_HEIGHT_MM = 1100
-        OUTER_WIDTH_MM = 375
+        total_h = self._RAILING_HEIGHT_MM * scale
+        outer_w = max(4, self.RAILING_OUTER_WIDTH_MM * scale)
+        post_top_y = y - total_h
+        
+        # both posts are the same drawing, rendered once per scale and device ratio and blitted
+        pad = 4  # room for the dashed outline outside the post
+        dpr = painter.device().devicePixelRatioF()
+        key = (scale, dpr)
+        if self._railing_sprite is None or self._railing_sprite[0] != key:
+            sprite = QPixmap(math.ceil((outer_w + 2 * pad) * dpr), math.ceil((total_h + 2 * pad) * dpr))
+            sprite.setDevicePixelRatio(dpr)
+            sprite.fill(Qt.transparent)
+            sprite_painter = QPainter(sprite)
+            self._paint_railing(sprite_painter, pad, pad + total_h, scale)
+            sprite_painter.end()
+            self._railing_sprite = (key, sprite)
+        painter.drawPixmap(round(x) - pad, round(post_top_y) - pad, self._railing_sprite[1])
+        
+        # Return bounding box with actual outer width
+        return (x, post_top_y, x + outer_w, y, outer_w)
+
+    def _paint_railing(self, painter, x, y, scale):
+        """railing post drawing with its base's bottom-left corner at (x, y)"""
+        RAILING_HEIGHT_MM = self._RAILING_HEIGHT_MM
+        OUTER_WIDTH_MM = self.RAILING_OUTER_WIDTH_MM
         INNER_SPACING_MM = 275
         BASE_THICKNESS_MM = 100
         
@@ -886,7 +1216,10 @@ class BridgeCADWidget(QWidget):
         inner_bottom_margin = post_h * 0.05
         inner_height = post_h - inner_top_margin - inner_bottom_margin
         
-        if inner_w > 3 and inner_height > 5:
+        # detail that would not resolve on the device is skipped, sizes in device pixels
+        dpr = painter.device().devicePixelRatioF()
+        
+        if inner_w * dpr > 3 and inner_height > 5:
             painter.setBrush(QBrush(QColor(255, 255, 255)))
             painter.setPen(QPen(QColor(120, 120, 120), max(1, scale)))
             
@@ -897,25 +1230,27 @@ class BridgeCADWidget(QWidget):
             rail_spacing = inner_height / (n_rails + 1)
             rail_height = max(2, 3 * scale)
             
-            painter.setBrush(QBrush(QColor(180, 180, 180)))
-            painter.setPen(QPen(QColor(100, 100, 100), max(0.5, scale * 0.5)))
-            
-            for i in range(1, n_rails + 1):
-                rail_y = post_top_y + inner_top_margin + i * rail_spacing - rail_height/2
-                rail_rect = QRectF(inner_x + 2, rail_y, inner_w - 4, rail_height)
-                painter.drawRect(rail_rect)
-        
-        painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.DashLine))
-        painter.setBrush(Qt.NoBrush)
-        outline_margin = 2
-        outline_rect = QRectF(rect_x - outline_margin,
-                            post_top_y - outline_margin,
-                            outer_w + 2 * outline_margin,
-                            total_h + 2 * outline_margin)
-        painter.drawRoundedRect(outline_rect, corner_radius + 2, corner_radius + 2)
-        
-        # Return bounding box with actual outer width
-        return (rect_x, post_top_y, rect_x + outer_w, y, outer_w)
+            # rails need width inside the post and a visible gap between them,
+            # otherwise they only merge into one gray block
+            if (inner_w - 4) * dpr >= 1 and (rail_spacing - rail_height) * dpr >= 1:
+                painter.setBrush(QBrush(QColor(180, 180, 180)))
+                painter.setPen(QPen(QColor(100, 100, 100), max(0.5, scale * 0.5)))
+                
+                for i in range(1, n_rails + 1):
+                    rail_y = post_top_y + inner_top_margin + i * rail_spacing - rail_height/2
+                    rail_rect = QRectF(inner_x + 2, rail_y, inner_w - 4, rail_height)
+                    painter.drawRect(rail_rect)
+        
+        # the dashed outline only reads as one around a post of some size
+        if total_h > 20 and outer_w > 6:
+            painter.setPen(QPen(QColor(150, 150, 150), 1, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            outline_margin = 2
+            outline_rect = QRectF(rect_x - outline_margin,
+                                post_top_y - outline_margin,
+                                outer_w + 2 * outline_margin,
+                                total_h + 2 * outline_margin)
+            painter.drawRoundedRect(outline_rect, corner_radius + 2, corner_radius + 2)
 
     def add_professional_cross_section_dimensions(self, painter, deck_left_x, deck_right_x,
                         carriageway_start_x, carriageway_end_x,
@@ -928,15 +1263,17 @@ class BridgeCADWidget(QWidget):
                             crash_barrier_width_px=None, left_barrier_end_x=None, right_barrier_end_x=None):
         """Add organized dimension lines with extension lines - with median support"""
         
-        fp_thick_px = self.params['footpath_thickness'] * scale
-        deck_thick_px = self.params['deck_thickness'] * scale
+        p = self.params
+        labels = self._labels
+        fp_thick_px = p['footpath_thickness'] * scale
+        deck_thick_px = p['deck_thickness'] * scale
         
         CRASH_BARRIER_VISUAL_WIDTH = 350.0  # BOTTOM_WIDTH
         crash_barrier_visual_px = CRASH_BARRIER_VISUAL_WIDTH * scale
         
         # Calculate barrier positions if not passed
         if crash_barrier_width_px is None:
-            crash_barrier_width_px = self.params['crash_barrier_width'] * scale
+            crash_barrier_width_px = p['crash_barrier_width'] * scale
         if left_barrier_end_x is None:
             left_barrier_end_x = left_barrier_x + crash_barrier_width_px
         if right_barrier_end_x is None:
@@ -950,7 +1287,6 @@ class BridgeCADWidget(QWidget):
         
         # LEVEL 1: Overall Bridge Width
         y_level1 = deck_top_y - 115
-        total_width_m = (deck_right_x - deck_left_x) / scale / 1000.0
 
         self.draw_dimension_arrow(
             painter,
@@ -962,12 +1298,9 @@ class BridgeCADWidget(QWidget):
         )
 
         mid_x = (deck_left_x + deck_right_x) / 2.0
-        label_text = f"Overall Bridge Width = {total_width_m:.2f} m"
+        label_text = labels['overall_width']
 
-        font = QFont('Arial', 7, QFont.Bold)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_w = metrics.boundingRect(label_text).width()
+        text_w, _, _ = self._text_size(label_text, self._font_label, painter.device())
         text_y = y_level1 - 8
 
         self.draw_text_with_background(
@@ -975,8 +1308,8 @@ class BridgeCADWidget(QWidget):
             mid_x - text_w / 2.0,
             text_y,
             label_text,
-            QColor(255, 255, 255, 240),
-            QColor(0, 0, 0),
+            self._COLOR_LABEL_BG,
+            self._COLOR_BLACK,
             7,
             True
         )
@@ -984,15 +1317,15 @@ class BridgeCADWidget(QWidget):
         # LEVEL 2: Footpath dimensions
         y_level2 = deck_top_y - 85
         
+        fp_visible_m = labels['footpath_width_m']
+        
         if fp_config in ['left', 'both'] and left_fp_width > 0:
             fp_start_x = deck_left_x + railing_width_px
             fp_end_x = left_barrier_x
-            fp_visible_mm = (fp_end_x - fp_start_x) / scale
-            fp_visible_m = fp_visible_mm / 1000
             if fp_visible_m > 0:
                 self.draw_dimension_arrow(painter, fp_start_x, y_level2, 
                                         fp_end_x, y_level2,
-                                        f"Footpath Width = {fp_visible_m:.2f} m", True, 
+                                        labels['footpath_width'], True, 
                                         extension_direction='down',
                                         extension_end_y=fp_top_y)
         
@@ -1003,32 +1336,28 @@ class BridgeCADWidget(QWidget):
         actual_cw_end = right_barrier_visual_start
         
         if median_present and median_start_x is not None and median_end_x is not None:
-            cw_m = self.params['carriageway_width'] / 1000
-            
             # Left carriageway - starts exactly at left barrier visual end
             self.draw_dimension_arrow(painter, actual_cw_start, y_level2c, median_start_x, y_level2c,
-                                    f"Carriageway = {cw_m:.2f} m", True, 
+                                    labels['carriageway'], True, 
                                     extension_direction='down',
                                     extension_end_y=deck_top_y)
             
             # Median dimension
-            median_m = median_width / 1000
             self.draw_dimension_arrow(painter, median_start_x, y_level2c - 25, median_end_x, y_level2c - 25,
-                                    f"Median = {median_m:.2f} m", True, 
+                                    labels['median'], True, 
                                     extension_direction='down',
                                     extension_end_y=deck_top_y)
             
             # Right carriageway - ends exactly at right barrier visual start
             self.draw_dimension_arrow(painter, median_end_x, y_level2c, actual_cw_end, y_level2c,
-                                    f"Carriageway = {cw_m:.2f} m", True, 
+                                    labels['carriageway'], True, 
                                     extension_direction='down',
                                     extension_end_y=deck_top_y)
         else:
             # Single carriageway
-            cw_m = self.params['carriageway_width'] / 1000
             # From left barrier visual end to right barrier visual start
             self.draw_dimension_arrow(painter, actual_cw_start, y_level2c, actual_cw_end, y_level2c,
-                                    f"Carriageway Width = {cw_m:.2f} m", True, 
+                                    labels['carriageway_width'], True, 
                                     extension_direction='down',
                                     extension_end_y=deck_top_y)
         
@@ -1036,12 +1365,10 @@ class BridgeCADWidget(QWidget):
         if fp_config in ['right', 'both'] and right_fp_width > 0:
             fp_start_x = right_barrier_end_x
             fp_end_x = deck_right_x - railing_width_px
-            fp_visible_mm = (fp_end_x - fp_start_x) / scale
-            fp_visible_m = fp_visible_mm / 1000
             if fp_visible_m > 0:
                 self.draw_dimension_arrow(painter, fp_start_x, y_level2, 
                                         fp_end_x, y_level2,
-                                        f"Footpath Width = {fp_visible_m:.2f} m", True, 
+                                        labels['footpath_width'], True, 
                                         extension_direction='down',
                                         extension_end_y=fp_top_y)
         
@@ -1050,9 +1377,8 @@ class BridgeCADWidget(QWidget):
         
         if n > 0 and len(positions) > 0:
             first_girder_x = positions[0]
-            overhang_m = self.params.get('deck_overhang', 1000) / 1000
             self.draw_dimension_arrow(painter, deck_left_x, y_level3, first_girder_x, y_level3,
-                                    f"Overhang = {overhang_m:.2f} m", True, 
+                                    labels['overhang'], True, 
                                     extension_direction='up',
                                     extension_end_y=deck_bottom_y)
         
@@ -1062,27 +1388,24 @@ class BridgeCADWidget(QWidget):
             x_left = positions[0]
             x_right = positions[1]
             
-            gs_m = self.params['girder_spacing'] / 1000
             self.draw_dimension_arrow(painter, x_left, y_level4, x_right, y_level4,
-                                    f"Girder Spacing = {gs_m:.2f} m", True, 
+                                    labels['girder_spacing'], True, 
                                     extension_direction='up',
                                     extension_end_y=base_y)
         
         # FOOTPATH THICKNESS DIMENSION 
-        fp_t_mm = self.params['footpath_thickness']
         
         if fp_config in ['left', 'both'] and left_fp_width > 0 and fp_thick_px > 5:
             x_dim = deck_left_x - 8
             self.draw_vertical_dimension_with_arrow(painter, x_dim, fp_top_y, deck_bottom_y,
-                                                    f"Footpath\nThickness = {fp_t_mm:.0f} mm", 'left')
+                                                    labels['footpath_thickness'], 'left')
         
         if fp_config == 'right' and right_fp_width > 0 and fp_thick_px > 5:
             x_dim = deck_right_x + 8
             self.draw_vertical_dimension_with_arrow(painter, x_dim, fp_top_y, deck_bottom_y,
-                                                    f"Footpath\nThickness = {fp_t_mm:.0f} mm", 'right')
+                                                    labels['footpath_thickness'], 'right')
         
         # DECK THICKNESS DIMENSION - position adjusted for median
-        deck_t_mm = self.params['deck_thickness']
         deck_slab_left = left_barrier_x
         deck_slab_right = right_barrier_end_x
         
@@ -1094,66 +1417,52 @@ class BridgeCADWidget(QWidget):
             deck_center_x = (deck_slab_left + deck_slab_right) / 2
 
         if deck_thick_px > 5:
-            painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-            painter.drawLine(QPointF(deck_center_x, deck_top_y), QPointF(deck_center_x, deck_bottom_y))
-            
-            arrow_size = 4
-            painter.setBrush(QBrush(QColor(0, 0, 0)))
-            
-            top_arrow = [
-                QPointF(deck_center_x, deck_top_y),
-                QPointF(deck_center_x - arrow_size/2, deck_top_y + arrow_size),
-                QPointF(deck_center_x + arrow_size/2, deck_top_y + arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(top_arrow))
-            
-            bottom_arrow = [
-                QPointF(deck_center_x, deck_bottom_y),
-                QPointF(deck_center_x - arrow_size/2, deck_bottom_y - arrow_size),
-                QPointF(deck_center_x + arrow_size/2, deck_bottom_y - arrow_size)
-            ]
-            painter.drawPolygon(QPolygonF(bottom_arrow))
-            
+            # dimension line and both end ticks in one call
             tick_len = 4
-            painter.drawLine(QPointF(deck_center_x - tick_len, deck_top_y), 
-                            QPointF(deck_center_x + tick_len, deck_top_y))
-            painter.drawLine(QPointF(deck_center_x - tick_len, deck_bottom_y), 
-                            QPointF(deck_center_x + tick_len, deck_bottom_y))
+            painter.setPen(self._PEN_BLACK)
+            painter.drawLines([QLineF(deck_center_x, deck_top_y, deck_center_x, deck_bottom_y),
+                               QLineF(deck_center_x - tick_len, deck_top_y,
+                                      deck_center_x + tick_len, deck_top_y),
+                               QLineF(deck_center_x - tick_len, deck_bottom_y,
+                                      deck_center_x + tick_len, deck_bottom_y)])
+            
+            painter.setBrush(self._BRUSH_BLACK)
+            
+            self._draw_arrow_head(painter, self._ARROW_V_TOP, deck_center_x, deck_top_y)
+            
+            self._draw_arrow_head(painter, self._ARROW_V_BOTTOM, deck_center_x, deck_bottom_y)
             
             # Renamed to "Deck Thickness"
-            text = f"Deck Thickness = {deck_t_mm:.0f} mm"
-            font = QFont('Arial', 7, QFont.Bold)
-            painter.setFont(font)
-            metrics = painter.fontMetrics()
-            text_width = metrics.boundingRect(text).width()
+            text = labels['deck_thickness']
+            text_width, _, _ = self._text_size(text, self._font_label, painter.device())
             text_x = deck_center_x - text_width / 2
             text_y = deck_top_y - 8
             
             self.draw_text_with_background(painter, text_x, text_y, text,
-                                        QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
-    def add_cross_section_hover_labels(self, painter, carriageway_start_x, carriageway_end_x,
-                    left_barrier_x, right_barrier_x, deck_top_y, deck_bottom_y,
-                    deck_thick_px, positions, base_y, scale, n, fp_config,
-                    deck_left_x, deck_right_x, left_fp_width, 
-                    right_fp_width, fp_top_y, fp_thick_px,
-                    left_fp_x, right_fp_x, left_railing_rect, right_railing_rect,
-                    railing_width_px, median_present, median_start_x, median_end_x, median_width,
-                    deck_slab_left, deck_slab_right,
-                    crash_barrier_width_px=None, left_barrier_end_x=None, right_barrier_end_x=None):
-        """Hover labels with specific positioning requirements"""
-        
-        # Calculate if not passed
-        if crash_barrier_width_px is None:
-            crash_barrier_width_px = self.params['crash_barrier_width'] * scale
-        if left_barrier_end_x is None:
-            left_barrier_end_x = left_barrier_x + crash_barrier_width_px
-        if right_barrier_end_x is None:
-            right_barrier_end_x = right_barrier_x + crash_barrier_width_px
+                                        self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
+
+    def _compute_hover_regions(self):
+        """cross-section hover regions from pure geometry, rebuilt only when params or size changed"""
+        if not self._hover_regions_dirty:
+            return
+        self._hover_regions_dirty = False
+        
+        g = self._cross_section_layout()
+        scale, base_y, n, positions, fp_config = g['scale'], g['base_y'], g['n'], g['positions'], g['fp_config']
+        left_fp_width, right_fp_width = g['left_fp_width'], g['right_fp_width']
+        deck_top_y, deck_bottom_y, deck_thick_px = g['deck_top_y'], g['deck_bottom_y'], g['deck_thick_px']
+        fp_top_y, fp_thick_px, deck_right_x = g['fp_top_y'], g['fp_thick_px'], g['deck_right_x']
+        deck_slab_left, deck_slab_right = g['deck_slab_left'], g['deck_slab_right']
+        left_fp_x, railing_width_px = g['left_fp_x'], g['railing_width_px']
+        left_barrier_x, right_barrier_x = g['left_barrier_x'], g['right_barrier_x']
+        right_barrier_end_x, crash_barrier_width_px = g['right_barrier_end_x'], g['crash_barrier_width_px']
+        left_railing_rect, right_railing_rect = g['left_railing_rect'], g['right_railing_rect']
+        median_present, median_start_x, median_end_x = g['median_present'], g['median_start_x'], g['median_end_x']
         
         cb_height = self.crash_barrier['height'] * scale
-        visual = self.girder_visual_scale
-        girder_depth_visual = self.girder['depth'] * scale * visual['depth']
-        bf = self.girder['flange_width'] * scale * visual['flange_width']
+        girder_px = g['girder_px']
+        girder_depth_visual = girder_px['depth']
+        bf = girder_px['flange_width']
         
         # Common label line Y position (below girders)
         label_line_y = base_y + 80
@@ -1221,10 +1530,8 @@ class BridgeCADWidget(QWidget):
                             median_center_x, deck_bottom_y, 'straight_line', None))
         
         # Girders with stiffeners - pointer 50 below
-        for i, girder_x in enumerate(positions):
-            stiff_w = self.stiffener['width'] * scale * visual['flange_width']
-            tw = self.girder['web_thickness'] * scale * visual['web_thickness']
-            total_width = bf + 2 * stiff_w
+        total_width = bf + 2 * girder_px['stiffener_width']
+        for girder_x in positions:
             girder_rect = QRectF(girder_x - total_width/2, base_y - girder_depth_visual, 
                                 total_width, girder_depth_visual)
             components.append((girder_rect, "Girder",
@@ -1241,67 +1548,91 @@ class BridgeCADWidget(QWidget):
                     components.append((bracing_rect, "Cross Bracing",
                                     center_x, base_y - girder_depth_visual / 2, 'lower_pointer', None))
         
-        # Register all for hover detection
-        for rect, name, tx, ty, ltype, extra in components:
-            self.hover_labels.append((rect, name, QColor(255, 255, 255, 240), QColor(60, 60, 60)))
+        # Register all for hover detection, the label itself is drawn per paint
+        self.hover_labels = [(rect, name, self._COLOR_LABEL_BG, self._COLOR_HOVER_TEXT)
+                             for rect, name, tx, ty, ltype, extra in components]
+        self._hover_bounds = [(r.left(), r.top(), r.right(), r.bottom())
+                              for r in (c[0].normalized() for c in components)]
+        self._hover_components = components
+        self._hover_label_line_y = label_line_y
+
+    def _hover_label_rect(self, index):
+        """Conservative widget-space bounds of a cross-section hover label (None if no label)"""
+        if index < 0 or index >= len(self._hover_components):
+            return None
+        rect, name, target_x, target_y, label_type, extra = self._hover_components[index]
+        
+        # label anchor, mirroring draw_cross_section_hover_label
+        if label_type == 'on_figure_top':
+            anchor_x, anchor_y = target_x, target_y
+        elif label_type == 'straight_line':
+            anchor_x, anchor_y = target_x, self._hover_label_line_y
+        elif label_type == 'tilted_line_left':
+            anchor_x, anchor_y = target_x - 80, self._hover_label_line_y
+        else:
+            anchor_x = target_x + 40 if target_x < self.width() / 2 else target_x - 40
+            anchor_y = target_y + 50
+        
+        text_w, text_h, _ = self._text_size(name, self._font_label)
+        
+        # leader line/marker plus a text box allowed on either side of the anchor
+        bounds = QRectF(QPointF(target_x, target_y), QPointF(anchor_x, anchor_y)).normalized()
+        bounds = bounds.united(QRectF(anchor_x - text_w - 10, anchor_y - text_h - 10,
+                                      2 * text_w + 20, 2 * text_h + 26))
+        return bounds.adjusted(-6, -6, 6, 6)
+
+    def draw_cross_section_hover_label(self, painter):
+        """Draw the label of the hovered cross-section component on top of the static layer"""
+        components = self._hover_components
+        label_line_y = self._hover_label_line_y
         
         # Draw label only for hovered component
         if self.hovered_label_index >= 0 and self.hovered_label_index < len(components):
             rect, name, target_x, target_y, label_type, extra = components[self.hovered_label_index]
             
             if label_type == 'on_figure_top':
-                font = QFont('Arial', 7, QFont.Bold)
-                painter.setFont(font)
-                metrics = painter.fontMetrics()
-                text_width = metrics.boundingRect(name).width()
-                text_height = metrics.height()
+                text_width, text_height, _ = self._text_size(name, self._font_label, painter.device())
                 
                 text_x = target_x - text_width / 2
                 text_y = target_y - 5
                 
                 self.draw_text_with_background(painter, text_x, text_y, name,
-                                            QColor(255, 255, 255, 220), QColor(60, 60, 60), 7, True)
+                                            self._COLOR_HOVER_BG, self._COLOR_HOVER_TEXT, 7, True)
             
             elif label_type == 'straight_line':
-                painter.setPen(QPen(QColor(100, 100, 100), 1.0, Qt.DotLine))
+                painter.setPen(self._PEN_HOVER_LEADER)
                 painter.drawLine(QPointF(target_x, target_y), QPointF(target_x, label_line_y))
                 
-                painter.setPen(QPen(QColor(100, 100, 100), 1.5))
+                painter.setPen(self._PEN_HOVER_RING)
                 painter.setBrush(Qt.NoBrush)
                 painter.drawEllipse(QPointF(target_x, target_y), 3, 3)
                 
-                font = QFont('Arial', 7, QFont.Bold)
-                painter.setFont(font)
-                metrics = painter.fontMetrics()
-                text_width = metrics.boundingRect(name).width()
+                text_width, _, _ = self._text_size(name, self._font_label, painter.device())
                 
                 text_x = target_x - text_width / 2
                 text_y = label_line_y + 12
                 
                 self.draw_text_with_background(painter, text_x, text_y, name,
-                                            QColor(255, 255, 255, 240), QColor(60, 60, 60), 7, True)
+                                            self._COLOR_LABEL_BG, self._COLOR_HOVER_TEXT, 7, True)
             
             elif label_type == 'tilted_line_left':
                 label_x = target_x - 80
                 label_y = label_line_y
                 
-                painter.setPen(QPen(QColor(100, 100, 100), 1.0, Qt.DotLine))
+                painter.setPen(self._PEN_HOVER_LEADER)
                 painter.drawLine(QPointF(target_x, target_y), QPointF(label_x, label_y))
                 
-                painter.setPen(QPen(QColor(100, 100, 100), 1.5))
+                painter.setPen(self._PEN_HOVER_RING)
                 painter.setBrush(Qt.NoBrush)
                 painter.drawEllipse(QPointF(target_x, target_y), 3, 3)
                 
-                font = QFont('Arial', 7, QFont.Bold)
-                painter.setFont(font)
-                metrics = painter.fontMetrics()
-                text_width = metrics.boundingRect(name).width()
+                text_width, _, _ = self._text_size(name, self._font_label, painter.device())
                 
                 text_x = label_x - text_width - 5
                 text_y = label_y + 4
                 
                 self.draw_text_with_background(painter, text_x, text_y, name,
-                                            QColor(255, 255, 255, 240), QColor(60, 60, 60), 7, True)
+                                            self._COLOR_LABEL_BG, self._COLOR_HOVER_TEXT, 7, True)
             
             elif label_type == 'lower_pointer':
                 label_y = target_y + 50
@@ -1312,111 +1643,128 @@ class BridgeCADWidget(QWidget):
                     label_x = target_x - 40
                 
                 self.draw_clean_leader_line(painter, target_x, target_y, label_x, label_y,
-                                            name, QColor(60, 60, 60), QColor(120, 120, 120))
+                                            name, self._COLOR_HOVER_TEXT, self._COLOR_HOVER_LEADER)
 
     def draw_vertical_dimension_with_arrow(self, painter, x, y1, y2, text, side='left'):
         """Draw vertical dimension with arrow and text"""
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        # Main vertical line
-        painter.drawLine(QPointF(x, y1), QPointF(x, y2))
+        painter.setPen(self._PEN_BLACK)
         
+        # Main vertical line and end ticks
         tick_len = 4
-        painter.drawLine(QPointF(x - tick_len, y1), QPointF(x + tick_len, y1))
-        painter.drawLine(QPointF(x - tick_len, y2), QPointF(x + tick_len, y2))
+        painter.drawLines([QLineF(x, y1, x, y2),
+                           QLineF(x - tick_len, y1, x + tick_len, y1),
+                           QLineF(x - tick_len, y2, x + tick_len, y2)])
         
-        arrow_size = 4
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setBrush(self._BRUSH_BLACK)
         
-        top_arrow = [
-            QPointF(x, y1),
-            QPointF(x - arrow_size/2, y1 + arrow_size),
-            QPointF(x + arrow_size/2, y1 + arrow_size)
-        ]
-        painter.drawPolygon(QPolygonF(top_arrow))
+        self._draw_arrow_head(painter, self._ARROW_V_TOP, x, y1)
         
-        bottom_arrow = [
-            QPointF(x, y2),
-            QPointF(x - arrow_size/2, y2 - arrow_size),
-            QPointF(x + arrow_size/2, y2 - arrow_size)
-        ]
-        painter.drawPolygon(QPolygonF(bottom_arrow))
+        self._draw_arrow_head(painter, self._ARROW_V_BOTTOM, x, y2)
         
         # TEXT PART (multi-line)
-        font = QFont('Arial', 7, QFont.Bold)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        
-        # Split into lines using \n
-        lines = text.split('\n')
-        line_height = metrics.height()
-        max_width = max(metrics.boundingRect(line).width() for line in lines)
+        painter.setFont(self._font_label)
+        
+        # lines split on \n, laid out once per text
+        lines, max_width, line_height, _ = self._text_block(text, self._font_label, painter.device())
         total_height = line_height * len(lines)
         
         # Center vertically between y1 & y2
         center_y = (y1 + y2) / 2.0
         
-        # First baseline y (use ascent to keep text nicely placed)
-        first_baseline_y = center_y - total_height / 2.0 + metrics.ascent()
-        
         # X placement left or right
         if side == 'left':
             text_x = x - max_width - 8
         else:
             text_x = x + 8
         
-        # Background rect
+        # Background rect around the text block
         margin = 2
-        bg_rect = QRectF(
-            text_x - margin,
-            center_y - total_height / 2.0 - margin,
-            max_width + 2 * margin,
-            total_height + 2 * margin
-        )
+        text_rect = QRectF(text_x, center_y - total_height / 2.0, max_width, total_height)
+        bg_rect = text_rect.adjusted(-margin, -margin, margin, margin)
         
-        painter.save()
+        # no save/restore, the text pen is set right after and text ignores the brush
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(255, 255, 255, 240)))
+        painter.setBrush(self._BRUSH_LABEL_BG)
         painter.drawRect(bg_rect)
-        painter.restore()
         
-        # Draw each line
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
+        # cached static text per line, one line height apart from the top of the block
+        painter.setPen(self._PEN_BLACK)
         for i, line in enumerate(lines):
-            painter.drawText(
-                QPointF(text_x, first_baseline_y + i * line_height),
-                line
-            )
+            painter.drawStaticText(QPointF(text_x, text_rect.top() + i * line_height), self._static_text(line))
+
+    @staticmethod
+    def _bracing_segments(positions, top, bottom, spacing):
+        """(x1, y1, x2, y2) of the doubled X-brace lines between each pair of girders,
+        each diagonal drawn as two lines spacing apart"""
+        segments = []
+        # constant per paint: every panel spans the full girder depth
+        dy = bottom - top
+        half_spacing = spacing / 2
+        last_dx = None
+        length = 0
+        for x1, x2 in zip(positions, positions[1:]):
+            dx = x2 - x1
+            # girders are evenly spaced (bar clamped end girders), so the previous
+            # panel's offsets nearly always still apply
+            if last_dx is None or abs(dx - last_dx) > 1e-9:
+                last_dx = dx
+                length = math.hypot(dx, dy)
+                if length > 0:
+                    # offset of the doubled lines along each diagonal's normal; the
+                    # other diagonal's normal is this one mirrored in x
+                    off_x = -dy / length * half_spacing
+                    off_y = dx / length * half_spacing
+            
+            if length > 0:
+                segments += [(x1 + off_x, top + off_y, x2 + off_x, bottom + off_y),
+                             (x1 - off_x, top - off_y, x2 - off_x, bottom - off_y),
+                             (x2 - off_x, top + off_y, x1 - off_x, bottom + off_y),
+                             (x2 + off_x, top - off_y, x1 + off_x, bottom - off_y)]
+        return segments
+
+    def _girder_px(self, scale):
+        """girder and stiffener dimensions in pixels at a drawing scale, visual exaggeration applied"""
+        visual = self.girder_visual_scale
+        return {
+            'depth': self.girder['depth'] * scale * visual['depth'],
+            'flange_width': self.girder['flange_width'] * scale * visual['flange_width'],
+            'flange_thickness': self.girder['flange_thickness'] * scale * visual['flange_thickness'],
+            'web_thickness': self.girder['web_thickness'] * scale * visual['web_thickness'],
+            'stiffener_width': self.stiffener['width'] * scale * visual['flange_width'],
+            'stiffener_height': self.stiffener['height'] * scale * visual['depth'],
+        }
 
-    def draw_i_section(self, painter, x, base_y, scale, girder_color):
+    def draw_i_section(self, painter, x, base_y, scale, girder_color, dims=None):
         """Draw I-section girder"""
-        visual = self.girder_visual_scale
-        d = self.girder['depth'] * scale * visual['depth']
-        bf = self.girder['flange_width'] * scale * visual['flange_width']
-        tf = self.girder['flange_thickness'] * scale * visual['flange_thickness']
-        tw = self.girder['web_thickness'] * scale * visual['web_thickness']
+        if dims is None:
+            dims = self._girder_px(scale)
+        d = dims['depth']
+        bf = dims['flange_width']
+        tf = dims['flange_thickness']
+        tw = dims['web_thickness']
         
-        painter.setBrush(QBrush(girder_color))
-        painter.setPen(QPen(QColor(0, 0, 0), 1.5))
+        painter.setBrush(girder_color)
+        painter.setPen(self._PEN_THIN)
         
         painter.drawRect(QRectF(x - bf/2, base_y - tf, bf, tf))
         web_height = d - 2*tf
         painter.drawRect(QRectF(x - tw/2, base_y - d + tf, tw, web_height))
         painter.drawRect(QRectF(x - bf/2, base_y - d, bf, tf))
         
-    def draw_stiffeners(self, painter, x, base_y, scale, stiffener_color):
+    def draw_stiffeners(self, painter, x, base_y, scale, stiffener_color, dims=None):
         """Draw vertical stiffeners"""
-        visual = self.girder_visual_scale
+        if dims is None:
+            dims = self._girder_px(scale)
         
-        stiff_w = self.stiffener['width'] * scale * visual['flange_width']
-        stiff_h = self.stiffener['height'] * scale * visual['depth']
+        stiff_w = dims['stiffener_width']
+        stiff_h = dims['stiffener_height']
         
-        tw = self.girder['web_thickness'] * scale * visual['web_thickness']
-        flange_thick_visual = self.girder['flange_thickness'] * scale * visual['flange_thickness']
-        girder_depth_visual = self.girder['depth'] * scale * visual['depth']
+        tw = dims['web_thickness']
+        flange_thick_visual = dims['flange_thickness']
+        girder_depth_visual = dims['depth']
         
-        painter.setBrush(QBrush(stiffener_color))
-        painter.setPen(QPen(QColor(0, 0, 0), 1))
+        painter.setBrush(stiffener_color)
+        painter.setPen(self._PEN_STIFFENER)
         
         stiff_top_y = base_y - girder_depth_visual + flange_thick_visual
         
@@ -1425,83 +1773,20 @@ class BridgeCADWidget(QWidget):
 
     def draw_crash_barrier(self, painter, x, y, scale, side='left'):
         """Draw RCC crash barrier matching the exact irc diamentions."""
-        
-        # DIMENSIONS (in mm)
-        TOTAL_HEIGHT = 900.0
-        TOP_WIDTH = 175.0
-        BOTTOM_WIDTH = 350.0
-        BASE_VERTICAL = 100.0
-        
-        # Scale everything
-        h = TOTAL_HEIGHT * scale
-        top_w = TOP_WIDTH * scale
-        bottom_w = BOTTOM_WIDTH * scale
-        base_v = BASE_VERTICAL * scale
-        
-        # Key Y positions (from deck going up, so negative)
-        y_bottom = y
-        y_base_top = y - base_v
-        y_mid = y - (1000 - 650) * scale
-        y_top = y - h
-        
-        # Offsets 
-        right_at_mid = (400 - 150) * scale   # 250 * scale
-        left_at_top = (200 - 150) * scale    # 50 * scale
-        right_at_top = (375 - 150) * scale   # 225 * scale
-        
-        if side == 'left':
-            # Left barrier: x is the LEFT edge (where barrier starts)
-            # Barrier extends to the RIGHT from x
-            
-            p0 = QPointF(x, y_bottom)                          # bottom-left
-            p1 = QPointF(x + bottom_w, y_bottom)               # bottom-right
-            p2 = QPointF(x + bottom_w, y_base_top)             # right after base
-            p3 = QPointF(x + right_at_mid, y_mid)              # right at middle
-            p4 = QPointF(x + right_at_top, y_top)              # top-right
-            p5 = QPointF(x + left_at_top, y_top)               # top-left
-            p6 = QPointF(x, y_base_top)                        # left after base
-            
-            points = [p0, p1, p2, p3, p4, p5, p6]
-            
-        else:  # right side
-            # Right barrier: x is the RIGHT edge (where barrier ends)
-            # Barrier extends to the LEFT from x
-            # The shape is mirrored so front (sloped side) faces left toward carriageway
-            
-            x_right = x                    # Right edge of barrier
-            x_left = x - bottom_w          # Left edge of barrier at bottom
-            
-            p0 = QPointF(x_left, y_bottom)                              # bottom-left
-            p1 = QPointF(x_right, y_bottom)                             # bottom-right
-            p2 = QPointF(x_right, y_base_top)                           # right after base
-            p3 = QPointF(x_right - left_at_top, y_top)                  # top-right (mirrored)
-            p4 = QPointF(x_right - right_at_top, y_top)                 # top-left (mirrored)
-            p5 = QPointF(x_right - right_at_mid, y_mid)                 # left at middle (mirrored)
-            p6 = QPointF(x_left, y_base_top)                            # left after base
-            
-            points = [p0, p1, p2, p3, p4, p5, p6]
+        # the mm profile scaled onto the deck, mirrored for the right barrier so the
+        # sloped front faces the carriageway; x is the outer edge of the barrier
+        sx = scale if side == 'left' else -scale
+        polygon = QTransform(sx, 0, 0, scale, x, y).map(self._BARRIER_PROFILE_MM)
         
         # Draw the barrier
-        painter.setBrush(QBrush(QColor(255, 210, 160)))
+        painter.setBrush(self._BRUSH_BARRIER)
         painter.setPen(QPen(QColor(0, 0, 0), max(1.5, scale * 1.5)))
-        painter.drawPolygon(QPolygonF(points))
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.drawPolygon(polygon)
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
-    def draw_top_view(self, painter):
-        """Draw top view with hover labels"""
-        # Clear top view hover zones
-        self.top_view_hover_zones = []
-        
-        # Define colors
-        GIRDER_COLOR = QColor(0, 100, 0)
-        CROSS_BRACING_COLOR = QColor(255, 140, 0)
-        END_DIAPHRAGM_COLOR = QColor(139, 69, 19)
-        
-        # Highlight colors 
-        GIRDER_HIGHLIGHT = QColor(0, 200, 0)
-        CROSS_BRACING_HIGHLIGHT = QColor(255, 200, 50)
-        END_DIAPHRAGM_HIGHLIGHT = QColor(200, 120, 50)
-        BEARING_HIGHLIGHT = QColor(255, 100, 100)
-        
+    def _top_view_layout(self):
+        """pure top view geometry in widget pixels, members follow the skew of the bearing lines"""
         width = self.width()
         height = self.height()
 
@@ -1525,12 +1810,9 @@ class BridgeCADWidget(QWidget):
         center_x = width / 2
         center_y = height / 2 - 40
 
-        title_text = "TOP VIEW - Girder and Cross Bracing Layout"
-        self.draw_text_with_background(painter, 30, 35, title_text,
-                                QColor(255, 245, 230, 250), QColor(0, 0, 100), 11, True)
-
         # FIX: Negate the skew angle
         skew_rad = math.radians(-self.params['skew_angle'])  # CHANGED: Added negative sign
+        tan_skew = math.tan(skew_rad)
         
         girder_positions_y = []
         
@@ -1548,33 +1830,9 @@ class BridgeCADWidget(QWidget):
         start_x_base = center_x - span_length_px / 2
         end_x_base = center_x + span_length_px / 2
 
-        # Check hover states
-        girder_hovered = self.hovered_top_view_element == 'girder'
-        bracing_hovered = self.hovered_top_view_element == 'cross_bracing'
-        diaphragm_hovered = self.hovered_top_view_element == 'end_diaphragm'
-        bearing_hovered = self.hovered_top_view_element == 'bearing'
-
-        # Draw girders
-        girder_color = GIRDER_HIGHLIGHT if girder_hovered else GIRDER_COLOR
-        girder_width = 4.5 if girder_hovered else 2.5
-        painter.setPen(QPen(girder_color, girder_width))
-        
-        girder_lines = []
-        for y_pos in girder_positions_y:
-            y_offset_from_first = y_pos - girder_positions_y[0]
-            x_offset = y_offset_from_first * math.tan(skew_rad)
-            
-            x1 = start_x_base + x_offset
-            x2 = end_x_base + x_offset
-            
-            painter.drawLine(QPointF(x1, y_pos), QPointF(x2, y_pos))
-            girder_lines.append({'y': y_pos, 'x1': x1, 'x2': x2})
-            
-            # Register hover zone with larger padding for easier selection
-            hover_padding = 15
-            self.top_view_hover_zones.append((
-                QRectF(x1, y_pos - hover_padding, x2 - x1, hover_padding * 2), 'girder'
-            ))
+        # skew shift of each girder line relative to the first, shared by every member
+        first_y = girder_positions_y[0]
+        girder_dx = [(y_pos - first_y) * tan_skew for y_pos in girder_positions_y]
 
         # Calculate bearing line positions
         bearing_gap_px = max(30, 0.3 * self.params['girder_spacing'] * scale)
@@ -1585,164 +1843,183 @@ class BridgeCADWidget(QWidget):
         left_bearing_base_x = start_x_base
         right_bearing_base_x = end_x_base
 
-        left_top_x = left_bearing_base_x + (top_extent - girder_positions_y[0]) * math.tan(skew_rad)
-        left_bottom_x = left_bearing_base_x + (bottom_extent - girder_positions_y[0]) * math.tan(skew_rad)
+        left_top_x = left_bearing_base_x + (top_extent - girder_positions_y[0]) * tan_skew
+        left_bottom_x = left_bearing_base_x + (bottom_extent - girder_positions_y[0]) * tan_skew
 
-        right_top_x = right_bearing_base_x + (top_extent - girder_positions_y[0]) * math.tan(skew_rad)
-        right_bottom_x = right_bearing_base_x + (bottom_extent - girder_positions_y[0]) * math.tan(skew_rad)
+        right_top_x = right_bearing_base_x + (top_extent - girder_positions_y[0]) * tan_skew
+        right_bottom_x = right_bearing_base_x + (bottom_extent - girder_positions_y[0]) * tan_skew
 
-        # Draw END DIAPHRAGMS
-        if n > 1:
-            diaphragm_color = END_DIAPHRAGM_HIGHLIGHT if diaphragm_hovered else END_DIAPHRAGM_COLOR
-            diaphragm_width = 4.0 if diaphragm_hovered else 3.0
+        # x of each intermediate cross bracing line where it meets the first girder
+        brace_bases = []
+        if self.params['cross_bracing_spacing'] > 0 and n > 1:
+            num_braces = max(1, int(math.ceil(self.params['span_length'] / self.params['cross_bracing_spacing'])))
+            actual_spacing_px = span_length_px / num_braces
+            brace_bases = [start_x_base + section * actual_spacing_px for section in range(1, num_braces)]
+
+        return {
+            'scale': scale, 'n': n, 'skew_rad': skew_rad, 'tan_skew': tan_skew,
+            'girder_positions_y': girder_positions_y, 'girder_dx': girder_dx,
+            'start_x_base': start_x_base, 'end_x_base': end_x_base,
+            'left_bearing_base_x': left_bearing_base_x, 'right_bearing_base_x': right_bearing_base_x,
+            'top_extent': top_extent, 'bottom_extent': bottom_extent,
+            'left_top_x': left_top_x, 'left_bottom_x': left_bottom_x,
+            'right_top_x': right_top_x, 'right_bottom_x': right_bottom_x,
+            'brace_bases': brace_bases,
+        }
+
+    def draw_top_view(self, painter):
+        """Draw top view with hover labels"""
+        # Clear top view hover zones
+        self.top_view_hover_zones = []
+        self._top_view_hover_grid = None
+        
+        g = self._top_view_layout()
+        scale, n, skew_rad, tan_skew = g['scale'], g['n'], g['skew_rad'], g['tan_skew']
+        girder_positions_y, girder_dx = g['girder_positions_y'], g['girder_dx']
+        start_x_base, end_x_base = g['start_x_base'], g['end_x_base']
+        left_bearing_base_x, right_bearing_base_x = g['left_bearing_base_x'], g['right_bearing_base_x']
+        top_extent, bottom_extent = g['top_extent'], g['bottom_extent']
+        left_top_x, left_bottom_x = g['left_top_x'], g['left_bottom_x']
+        right_top_x, right_bottom_x = g['right_top_x'], g['right_bottom_x']
+        brace_bases = g['brace_bases']
+        height = self.height()
+
+        title_text = "TOP VIEW - Girder and Cross Bracing Layout"
+        self.draw_text_with_background(painter, 30, 35, title_text,
+                                QColor(255, 245, 230, 250), QColor(0, 0, 100), 11, True)
+
+        # members are drawn unhighlighted here, the hovered one is redrawn on top
+        # from these lines by draw_top_view_hover
+        hover_shapes = self._top_view_hover_shapes = {}
+        self._top_view_hover_leaders = {}
+
+        # member pens are fractional widths at fractional positions, aliased they
+        # come out a pixel thicker or thinner from line to line
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        # Draw girders
+        painter.setPen(self._PEN_TOP_GIRDER[0])
+        
+        girder_lines = []
+        girder_qlines = []
+        for y_pos, x_offset in zip(girder_positions_y, girder_dx):
+            x1 = start_x_base + x_offset
+            x2 = end_x_base + x_offset
             
-            # Use solid line with slight offset for double-line effect
-            painter.setBrush(Qt.NoBrush)
+            girder_qlines.append(QLineF(x1, y_pos, x2, y_pos))
+            girder_lines.append({'y': y_pos, 'x1': x1, 'x2': x2})
             
-            # Left end diaphragm
-            for i in range(len(girder_positions_y) - 1):
-                y1 = girder_positions_y[i]
-                y2 = girder_positions_y[i + 1]
-                
-                y1_offset = y1 - girder_positions_y[0]
-                y2_offset = y2 - girder_positions_y[0]
-                
-                x1 = left_bearing_base_x + y1_offset * math.tan(skew_rad)
-                x2 = left_bearing_base_x + y2_offset * math.tan(skew_rad)
-                
-                # Draw double solid lines for end diaphragm
-                line_offset = 2
-                dx = x2 - x1
-                dy = y2 - y1
-                length = math.sqrt(dx*dx + dy*dy)
-                if length > 0:
-                    perp_x = -dy / length * line_offset
-                    perp_y = dx / length * line_offset
+            # Register hover zone with larger padding for easier selection
+            hover_padding = 15
+            self.top_view_hover_zones.append(
+                (x1, y_pos - hover_padding, x2, y_pos + hover_padding, 'girder'))
+        painter.drawLines(girder_qlines)
+        hover_shapes['girder'] = girder_qlines
+
+        # Draw END DIAPHRAGMS, both bearing lines in one pass with one pen
+        if n > 1:
+            # every segment runs along the skewed bearing line, (tan, 1) per unit of y,
+            # so the double lines sit at one constant offset either side of it
+            line_offset = 2
+            perp_x = -line_offset * math.cos(skew_rad)
+            perp_y = line_offset * math.sin(skew_rad)
+            
+            diaphragm_qlines = []
+            for bearing_base_x in (left_bearing_base_x, right_bearing_base_x):
+                for i in range(len(girder_positions_y) - 1):
+                    y1 = girder_positions_y[i]
+                    y2 = girder_positions_y[i + 1]
                     
-                    painter.setPen(QPen(diaphragm_color, diaphragm_width, Qt.SolidLine))
-                    painter.drawLine(QPointF(x1 + perp_x, y1 + perp_y), QPointF(x2 + perp_x, y2 + perp_y))
-                    painter.drawLine(QPointF(x1 - perp_x, y1 - perp_y), QPointF(x2 - perp_x, y2 - perp_y))
-                
-                
-                # Register hover zone with larger padding
-                hover_padding = 20
-                min_x, max_x = min(x1, x2) - hover_padding, max(x1, x2) + hover_padding
-                min_y, max_y = min(y1, y2), max(y1, y2)
-                self.top_view_hover_zones.append((
-                    QRectF(min_x, min_y, max_x - min_x, max_y - min_y), 'end_diaphragm'
-                ))
-            
-            # Right end diaphragm
-            for i in range(len(girder_positions_y) - 1):
-                y1 = girder_positions_y[i]
-                y2 = girder_positions_y[i + 1]
-                
-                y1_offset = y1 - girder_positions_y[0]
-                y2_offset = y2 - girder_positions_y[0]
-                
-                x1 = right_bearing_base_x + y1_offset * math.tan(skew_rad)
-                x2 = right_bearing_base_x + y2_offset * math.tan(skew_rad)
-                
-                # Draw double solid lines
-                line_offset = 2
-                dx = x2 - x1
-                dy = y2 - y1
-                length = math.sqrt(dx*dx + dy*dy)
-                if length > 0:
-                    perp_x = -dy / length * line_offset
-                    perp_y = dx / length * line_offset
+                    x1 = bearing_base_x + girder_dx[i]
+                    x2 = bearing_base_x + girder_dx[i + 1]
                     
-                    painter.setPen(QPen(diaphragm_color, diaphragm_width, Qt.SolidLine))
-                    painter.drawLine(QPointF(x1 + perp_x, y1 + perp_y), QPointF(x2 + perp_x, y2 + perp_y))
-                    painter.drawLine(QPointF(x1 - perp_x, y1 - perp_y), QPointF(x2 - perp_x, y2 - perp_y))
-                
-                
-                hover_padding = 20
-                min_x, max_x = min(x1, x2) - hover_padding, max(x1, x2) + hover_padding
-                min_y, max_y = min(y1, y2), max(y1, y2)
-                self.top_view_hover_zones.append((
-                    QRectF(min_x, min_y, max_x - min_x, max_y - min_y), 'end_diaphragm'
-                ))
+                    # Draw double solid lines for end diaphragm
+                    diaphragm_qlines.append(QLineF(x1 + perp_x, y1 + perp_y, x2 + perp_x, y2 + perp_y))
+                    diaphragm_qlines.append(QLineF(x1 - perp_x, y1 - perp_y, x2 - perp_x, y2 - perp_y))
+                    
+                    # Register hover zone with larger padding
+                    hover_padding = 20
+                    min_x, max_x = min(x1, x2) - hover_padding, max(x1, x2) + hover_padding
+                    min_y, max_y = min(y1, y2), max(y1, y2)
+                    self.top_view_hover_zones.append((min_x, min_y, max_x, max_y, 'end_diaphragm'))
+            painter.setPen(self._PEN_TOP_DIAPHRAGM[0])
+            painter.drawLines(diaphragm_qlines)
+            hover_shapes['end_diaphragm'] = diaphragm_qlines
 
         # Draw center line of bearings
-        bearing_color = BEARING_HIGHLIGHT if bearing_hovered else QColor(255, 0, 0)
-        bearing_width = 2.5 if bearing_hovered else 1.5
+        painter.setPen(self._PEN_TOP_BEARING[0])
         
-        pen = QPen(bearing_color, bearing_width, Qt.CustomDashLine)
-        pen.setDashPattern([8, 8])
-        painter.setPen(pen)
-        
-        painter.drawLine(QPointF(left_top_x, top_extent), 
-                        QPointF(left_bottom_x, bottom_extent))
-        painter.drawLine(QPointF(right_top_x, top_extent), 
-                        QPointF(right_bottom_x, bottom_extent))
+        bearing_qlines = [QLineF(left_top_x, top_extent, left_bottom_x, bottom_extent),
+                          QLineF(right_top_x, top_extent, right_bottom_x, bottom_extent)]
+        painter.drawLines(bearing_qlines)
+        hover_shapes['bearing'] = bearing_qlines
         
         # Register bearing hover zones with larger padding
         hover_padding = 20
-        self.top_view_hover_zones.append((
-            QRectF(min(left_top_x, left_bottom_x) - hover_padding, top_extent, 
-                abs(left_top_x - left_bottom_x) + hover_padding * 2, bottom_extent - top_extent), 'bearing'
-        ))
-        self.top_view_hover_zones.append((
-            QRectF(min(right_top_x, right_bottom_x) - hover_padding, top_extent,
-                abs(right_top_x - right_bottom_x) + hover_padding * 2, bottom_extent - top_extent), 'bearing'
-        ))
+        self.top_view_hover_zones.append((min(left_top_x, left_bottom_x) - hover_padding, top_extent,
+                                          max(left_top_x, left_bottom_x) + hover_padding, bottom_extent,
+                                          'bearing'))
+        self.top_view_hover_zones.append((min(right_top_x, right_bottom_x) - hover_padding, top_extent,
+                                          max(right_top_x, right_bottom_x) + hover_padding, bottom_extent,
+                                          'bearing'))
 
         # Cross bracing
         bracing_positions_x = []
-        if self.params['cross_bracing_spacing'] > 0 and n > 1:
-            span_length = self.params['span_length']
-            bracing_spacing = self.params['cross_bracing_spacing']
+        if brace_bases:
+            painter.setPen(self._PEN_TOP_BRACING[0])
             
-            num_braces = max(1, int(math.ceil(span_length / bracing_spacing)))
-            actual_spacing_px = span_length_px / num_braces
-            
-            bracing_color = CROSS_BRACING_HIGHLIGHT if bracing_hovered else CROSS_BRACING_COLOR
-            bracing_width = 3.5 if bracing_hovered else 1.8
-            painter.setPen(QPen(bracing_color, bracing_width))
-            
-            for section in range(1, num_braces):
-                brace_x_base = start_x_base + section * actual_spacing_px
-                
+            brace_qlines = []
+            for brace_x_base in brace_bases:
                 for i in range(len(girder_positions_y) - 1):
                     y1 = girder_positions_y[i]
                     y2 = girder_positions_y[i + 1]
                     
-                    y1_offset = y1 - girder_positions_y[0]
-                    y2_offset = y2 - girder_positions_y[0]
-                    
-                    x1 = brace_x_base + y1_offset * math.tan(skew_rad)
-                    x2 = brace_x_base + y2_offset * math.tan(skew_rad)
+                    x1 = brace_x_base + girder_dx[i]
+                    x2 = brace_x_base + girder_dx[i + 1]
                     
-                    painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+                    brace_qlines.append(QLineF(x1, y1, x2, y2))
                     
                     # Register hover zone with larger padding
                     hover_padding = 15
                     min_x, max_x = min(x1, x2) - hover_padding, max(x1, x2) + hover_padding
                     min_y, max_y = min(y1, y2), max(y1, y2)
-                    self.top_view_hover_zones.append((
-                        QRectF(min_x, min_y, max_x - min_x, max_y - min_y), 'cross_bracing'
-                    ))
+                    self.top_view_hover_zones.append((min_x, min_y, max_x, max_y, 'cross_bracing'))
                     
                     if i == 0:
                         bracing_positions_x.append(brace_x_base)
+            painter.drawLines(brace_qlines)
+            hover_shapes['cross_bracing'] = brace_qlines
 
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        
         # Draw skew angle indicator
         if abs(self.params['skew_angle']) > 0.1:
             self.draw_skew_angle_indicator(painter, girder_lines[0]['x1'], girder_positions_y[0], 
                                         skew_rad, scale, left_bearing_base_x)
 
-        # Add dimensions (always visible) and hover labels (only on hover)
+        # Add dimensions (always visible), hover labels are only laid out
         self.add_clean_top_view_dimensions(
             painter, girder_lines, girder_positions_y, scale, n, bracing_positions_x,
-            skew_rad, start_x_base, end_x_base, left_bearing_base_x, right_bearing_base_x,
-            top_extent, bottom_extent, left_top_x, right_top_x,
-            GIRDER_COLOR, CROSS_BRACING_COLOR, END_DIAPHRAGM_COLOR
+            skew_rad, tan_skew, start_x_base, end_x_base, left_bearing_base_x, right_bearing_base_x,
+            top_extent, bottom_extent, left_top_x, right_top_x
         )
 
         self.add_clean_top_view_notes(painter, height)
 
 
+    def draw_top_view_hover(self, painter):
+        """redraw the hovered top view member highlighted, with its leader label"""
+        element = self.hovered_top_view_element
+        lines = self._top_view_hover_shapes.get(element)
+        if lines is not None:
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setPen(self._PEN_TOP_MEMBER[element][1])
+            painter.drawLines(lines)
+            painter.setRenderHint(QPainter.Antialiasing, False)
+        leader = self._top_view_hover_leaders.get(element)
+        if leader is not None:
+            self.draw_clean_leader_line(painter, *leader)
+
     def draw_skew_angle_indicator(self, painter, girder_start_x, girder_y, skew_rad, scale, bearing_x):
         """Draw skew angle indicator with arc and proper sign display"""
         skew_deg = self.params['skew_angle']  # CHANGED
@@ -1756,16 +2033,21 @@ class BridgeCADWidget(QWidget):
         
         arc_radius = 50
         
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        
         # Draw vertical reference line (what 0 skew would look like)
-        painter.setPen(QPen(QColor(100, 100, 100), 1.5, Qt.DashLine))
+        painter.setPen(self._PEN_SKEW_REFERENCE)
         painter.drawLine(QPointF(ref_x, ref_y), QPointF(ref_x, ref_y - arc_radius - 20))
         
         # Draw the actual skewed bearing line direction
         # The skew causes the bearing line to rotate, so we show that angle
-        skewed_end_x = ref_x - arc_radius * math.sin(skew_rad)
-        skewed_end_y = ref_y - arc_radius * math.cos(skew_rad)
+        # skew_rad is the negated skew, so sin(skew_rad) = -skew_sin
+        skew_sin = self._skew_sin
+        skew_cos = self._skew_cos
+        skewed_end_x = ref_x + arc_radius * skew_sin
+        skewed_end_y = ref_y - arc_radius * skew_cos
         
-        painter.setPen(QPen(QColor(0, 100, 200), 2.0))
+        painter.setPen(self._PEN_SKEW_LINE)
         painter.drawLine(QPointF(ref_x, ref_y), QPointF(skewed_end_x, skewed_end_y))
         
         # Draw arc from vertical to skewed line
@@ -1778,13 +2060,14 @@ class BridgeCADWidget(QWidget):
         # Span angle is the skew angle (use original input value for arc direction)
         span_angle_deg = skew_deg
         
-        painter.setPen(QPen(QColor(0, 100, 200), 2.5))
+        painter.setPen(self._PEN_SKEW_ARC)
         painter.drawArc(arc_rect, int(start_angle_deg * 16), int(-span_angle_deg * 16))
         
         # Draw arrow at end of arc
+        # cos/sin of (90° - skew) are just sin/cos of the skew
         arrow_angle_rad = math.radians(90 - skew_deg)
-        arrow_x = ref_x + arc_radius * math.cos(arrow_angle_rad)
-        arrow_y = ref_y - arc_radius * math.sin(arrow_angle_rad)
+        arrow_x = ref_x + arc_radius * skew_sin
+        arrow_y = ref_y - arc_radius * skew_cos
         
         # Small arrow head at arc end
         arrow_size = 6
@@ -1798,8 +2081,9 @@ class BridgeCADWidget(QWidget):
             QPointF(arrow_x - arrow_size * math.cos(tangent_angle + 0.4),
                     arrow_y + arrow_size * math.sin(tangent_angle + 0.4))
         ]
-        painter.setBrush(QBrush(QColor(0, 100, 200)))
+        painter.setBrush(self._BRUSH_SKEW)
         painter.drawPolygon(QPolygonF(arrow_points))
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
         # Add angle label with proper sign - using ORIGINAL input value
         # Position label near the arc
@@ -1809,10 +2093,7 @@ class BridgeCADWidget(QWidget):
         label_y = ref_y - label_radius * math.sin(label_angle_rad)
         
         # Format with explicit sign (+ or -) - showing ORIGINAL input value
-        if skew_deg >= 0:
-            angle_text = f"Skew = +{abs(skew_deg):.1f}°"
-        else:
-            angle_text = f"Skew = {skew_deg:.1f}°"
+        angle_text = self._labels['skew']
         
         # Adjust label position based on skew direction
         if skew_deg > 0:
@@ -1825,10 +2106,9 @@ class BridgeCADWidget(QWidget):
                                     QColor(0, 100, 200), 8, True)
 
     def add_clean_top_view_dimensions(self, painter, girder_lines, girder_positions_y,
-                            scale, n, bracing_positions, skew_rad,
+                            scale, n, bracing_positions, skew_rad, tan_skew,
                             start_x_base, end_x_base, left_bearing_base_x, right_bearing_base_x,
-                            top_extent, bottom_extent, left_top_x, right_top_x,
-                            girder_color, cross_bracing_color, end_diaphragm_color):
+                            top_extent, bottom_extent, left_top_x, right_top_x):
         """Add dimensions (always visible) and hover labels (only on hover)"""
         
         if not girder_lines:
@@ -1840,7 +2120,7 @@ class BridgeCADWidget(QWidget):
         last_girder_y = last_girder['y']
         
         y_offset_last = last_girder_y - girder_positions_y[0]
-        x_offset_last = y_offset_last * math.tan(skew_rad)
+        x_offset_last = y_offset_last * tan_skew
         
         dim_y_base = last_girder_y + 50
         
@@ -1848,24 +2128,22 @@ class BridgeCADWidget(QWidget):
         dim_y1 = dim_y_base
         x1_span = last_girder['x1']
         x2_span = last_girder['x2']
-        span_m = self.params['span_length'] / 1000
         
         self.draw_dimension_arrow_with_extensions_up(
             painter, x1_span, dim_y1, x2_span, dim_y1,
-            f"Span Length = {span_m:.1f} m", last_girder_y
+            self._labels['span'], last_girder_y
         )
 
         # BRACING SPACING dimension (always visible)
         if self.params['cross_bracing_spacing'] > 0 and len(bracing_positions) > 1:
             dim_y2 = dim_y_base + 35
-            cb_spacing_m = self.params['cross_bracing_spacing'] / 1000
             
             x1_brace = bracing_positions[0] + x_offset_last
             x2_brace = bracing_positions[1] + x_offset_last
             
             self.draw_dimension_arrow_with_extensions_up(
                 painter, x1_brace, dim_y2, x2_brace, dim_y2,
-                f"Bracing Spacing = {cb_spacing_m:.2f} m", last_girder_y
+                self._labels['bracing_spacing'], last_girder_y
             )
 
         # GIRDER SPACING dimension (always visible)
@@ -1875,10 +2153,9 @@ class BridgeCADWidget(QWidget):
             
             y1_offset = y1 - girder_positions_y[0]
             y2_offset = y2 - girder_positions_y[0]
-            x1_at_end = end_x_base + y1_offset * math.tan(skew_rad) + 30
-            x2_at_end = end_x_base + y2_offset * math.tan(skew_rad) + 30
+            x1_at_end = end_x_base + y1_offset * tan_skew + 30
+            x2_at_end = end_x_base + y2_offset * tan_skew + 30
             
-            gs_m = self.params['girder_spacing'] / 1000
 
             # just the skewed dimension line + arrows, no text on it
             self.draw_skewed_dimension_arrow(
@@ -1891,7 +2168,7 @@ class BridgeCADWidget(QWidget):
             label_x = max(x1_at_end, x2_at_end) + 25
             label_y = (y1 + y2) / 2
 
-            label_text = f"Girder\nSpacing\n= {gs_m:.2f} m"
+            label_text = self._labels['girder_spacing_stacked']
 
             self.draw_text_with_background(
                 painter, label_x, label_y,
@@ -1914,10 +2191,11 @@ class BridgeCADWidget(QWidget):
                                     "CL of Bearing", QColor(255, 255, 255, 250),
                                     QColor(200, 0, 0), 7, True)
 
-        # HOVER LABELS (only shown when hovered) 
+        # HOVER LABELS, drawn by draw_top_view_hover only while their member is hovered
+        leaders = self._top_view_hover_leaders
         
-        # 1. GIRDER label - show only when girder is hovered
-        if len(girder_lines) > 0 and self.hovered_top_view_element == 'girder':
+        # 1. GIRDER label
+        if len(girder_lines) > 0:
             first_girder = girder_lines[0]
             target_x = (first_girder['x1'] + first_girder['x2']) / 2
             target_y = first_girder['y']
@@ -1925,11 +2203,11 @@ class BridgeCADWidget(QWidget):
             label_x = target_x
             label_y = target_y - 60
             
-            self.draw_clean_leader_line(painter, target_x, target_y, label_x, label_y,
-                                    "Girder", girder_color, QColor(0, 100, 0))
+            leaders['girder'] = (target_x, target_y, label_x, label_y,
+                                 "Girder", self._COLOR_TOP_GIRDER, self._COLOR_TOP_GIRDER)
 
-        # 2. CROSS BRACING label - show only when cross bracing is hovered
-        if n > 1 and len(bracing_positions) > 0 and self.hovered_top_view_element == 'cross_bracing':
+        # 2. CROSS BRACING label
+        if n > 1 and len(bracing_positions) > 0:
             brace_index = min(6, len(bracing_positions) - 1)
             brace_x_base = bracing_positions[brace_index]
             
@@ -1938,8 +2216,8 @@ class BridgeCADWidget(QWidget):
             
             y1_offset = y1 - girder_positions_y[0]
             y2_offset = y2 - girder_positions_y[0]
-            x1 = brace_x_base + y1_offset * math.tan(skew_rad)
-            x2 = brace_x_base + y2_offset * math.tan(skew_rad)
+            x1 = brace_x_base + y1_offset * tan_skew
+            x2 = brace_x_base + y2_offset * tan_skew
             
             target_x = (x1 + x2) / 2
             target_y = (y1 + y2) / 2
@@ -1948,18 +2226,19 @@ class BridgeCADWidget(QWidget):
             label_x = target_x - label_offset * math.sin(skew_rad)
             label_y = target_y - label_offset
             
-            self.draw_clean_leader_line(painter, target_x, target_y, label_x, label_y,
-                                    "Cross Bracing", cross_bracing_color, QColor(200, 100, 0))
+            leaders['cross_bracing'] = (target_x, target_y, label_x, label_y,
+                                        "Cross Bracing", self._COLOR_TOP_BRACING,
+                                        self._COLOR_TOP_BRACING_LEADER)
         
-        # 3. END DIAPHRAGM label - show only when end diaphragm is hovered
-        if n > 1 and len(girder_positions_y) >= 2 and self.hovered_top_view_element == 'end_diaphragm':
+        # 3. END DIAPHRAGM label
+        if n > 1 and len(girder_positions_y) >= 2:
             y1 = girder_positions_y[0]
             y2 = girder_positions_y[1]
             
             y1_offset = y1 - girder_positions_y[0]
             y2_offset = y2 - girder_positions_y[0]
-            x1 = left_bearing_base_x + y1_offset * math.tan(skew_rad)
-            x2 = left_bearing_base_x + y2_offset * math.tan(skew_rad)
+            x1 = left_bearing_base_x + y1_offset * tan_skew
+            x2 = left_bearing_base_x + y2_offset * tan_skew
             
             target_x = (x1 + x2) / 2
             target_y = (y1 + y2) / 2
@@ -1968,104 +2247,73 @@ class BridgeCADWidget(QWidget):
             label_x = target_x - label_offset - 10
             label_y = target_y + 20
             
-            self.draw_clean_leader_line(painter, target_x, target_y, label_x, label_y,
-                                    "End Diaphragm", end_diaphragm_color, QColor(139, 69, 19))
+            leaders['end_diaphragm'] = (target_x, target_y, label_x, label_y,
+                                        "End Diaphragm", self._COLOR_TOP_DIAPHRAGM,
+                                        self._COLOR_TOP_DIAPHRAGM)
 
     def draw_dimension_arrow_with_extensions_up(self, painter, x1, y1, x2, y2, text, girder_y):
         """Dimension line with arrows and extension lines going UP to girder level (dimension below)"""
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        # Draw main dimension line
-        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-        
-        # Draw extension lines going UP to girder (y1 > girder_y since dimension is below)
-        painter.setPen(QPen(QColor(100, 100, 100), 0.8, Qt.DotLine))
-        painter.drawLine(QPointF(x1, y1), QPointF(x1, girder_y))
-        painter.drawLine(QPointF(x2, y2), QPointF(x2, girder_y))
+        # Draw extension lines going UP to girder (y1 > girder_y since dimension is below),
+        # first so the black line and ticks stay on top where they meet
+        painter.setPen(self._PEN_DIM)
+        painter.drawLines(self._pooled_lines((x1, y1, x1, girder_y), (x2, y2, x2, girder_y)))
         
-        # Reset pen for arrows
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        # Draw end ticks
+        # main dimension line and both end ticks in one call
         ext_len = 6
-        painter.drawLine(QPointF(x1, y1 - ext_len), QPointF(x1, y1 + ext_len))
-        painter.drawLine(QPointF(x2, y2 - ext_len), QPointF(x2, y2 + ext_len))
+        painter.setPen(self._PEN_BLACK)
+        painter.drawLines(self._pooled_lines((x1, y1, x2, y2),
+                                             (x1, y1 - ext_len, x1, y1 + ext_len),
+                                             (x2, y2 - ext_len, x2, y2 + ext_len)))
         
         # Draw arrows
-        arrow_size = 4
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setBrush(self._BRUSH_BLACK)
         
-        left_arrow = [
-            QPointF(x1, y1),
-            QPointF(x1 + arrow_size, y1 - arrow_size/2),
-            QPointF(x1 + arrow_size, y1 + arrow_size/2)
-        ]
-        painter.drawPolygon(QPolygonF(left_arrow))
+        self._draw_arrow_head(painter, self._ARROW_H_LEFT, x1, y1)
         
-        right_arrow = [
-            QPointF(x2, y2),
-            QPointF(x2 - arrow_size, y2 - arrow_size/2),
-            QPointF(x2 - arrow_size, y2 + arrow_size/2)
-        ]
-        painter.drawPolygon(QPolygonF(right_arrow))
+        self._draw_arrow_head(painter, self._ARROW_H_RIGHT, x2, y2)
         
         # Draw text BELOW the dimension line (above in terms of value since we add to y)
         text_x = (x1 + x2) / 2
         text_y = y1 + 15  # Below the dimension line
         
-        font = QFont('Arial', 7, QFont.Bold)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_width = metrics.boundingRect(text).width()
+        text_width, _, _ = self._text_size(text, self._font_label, painter.device())
         
         self.draw_text_with_background(painter, text_x - text_width/2, text_y, text, 
-                                    QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                    self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
 
 
     def draw_skewed_dimension_arrow(self, painter, x1, y1, x2, y2, text, skew_rad):
         """Draw a dimension arrow that follows skew angle with horizontal text"""
-        painter.setPen(QPen(QColor(0, 0, 0), 0.8))
-        
-        painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-        
         dx = x2 - x1
         dy = y2 - y1
-        length = math.sqrt(dx * dx + dy * dy)
+        length = math.hypot(dx, dy)
         
         if length == 0:
             return
         
-        nx = dx / length
-        ny = dy / length
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self._PEN_BLACK)
         
-        px = -ny
-        py = nx
+        # line direction (cos, sin) and its unit perpendicular, no trig needed
+        inv_length = 1.0 / length
+        cos_a = dx * inv_length
+        sin_a = dy * inv_length
+        px = -sin_a
+        py = cos_a
         
+        # dimension line and both end ticks in one call
         tick_len = 5
+        painter.drawLines(self._pooled_lines(
+            (x1, y1, x2, y2),
+            (x1 - px * tick_len, y1 - py * tick_len, x1 + px * tick_len, y1 + py * tick_len),
+            (x2 - px * tick_len, y2 - py * tick_len, x2 + px * tick_len, y2 + py * tick_len)))
         
-        painter.drawLine(QPointF(x1 - px * tick_len, y1 - py * tick_len),
-                        QPointF(x1 + px * tick_len, y1 + py * tick_len))
-        painter.drawLine(QPointF(x2 - px * tick_len, y2 - py * tick_len),
-                        QPointF(x2 + px * tick_len, y2 + py * tick_len))
-        
-        arrow_size = 4
-        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setRenderHint(QPainter.Antialiasing, False)
         
-        angle1 = math.atan2(dy, dx)
-        arrow1 = [
-            QPointF(x1, y1),
-            QPointF(x1 + arrow_size * math.cos(angle1 - 2.5), y1 + arrow_size * math.sin(angle1 - 2.5)),
-            QPointF(x1 + arrow_size * math.cos(angle1 + 2.5), y1 + arrow_size * math.sin(angle1 + 2.5))
-        ]
-        painter.drawPolygon(QPolygonF(arrow1))
-        
-        angle2 = math.atan2(-dy, -dx)
-        arrow2 = [
-            QPointF(x2, y2),
-            QPointF(x2 + arrow_size * math.cos(angle2 - 2.5), y2 + arrow_size * math.sin(angle2 - 2.5)),
-            QPointF(x2 + arrow_size * math.cos(angle2 + 2.5), y2 + arrow_size * math.sin(angle2 + 2.5))
-        ]
-        painter.drawPolygon(QPolygonF(arrow2))
+        # arrow heads rotated onto the line, the far one turned half a turn
+        painter.setBrush(self._BRUSH_BLACK)
+        self._draw_arrow_head(painter, QTransform(cos_a, sin_a, -sin_a, cos_a, 0, 0).map(self._ARROW_ALONG_X), x1, y1)
+        self._draw_arrow_head(painter, QTransform(-cos_a, -sin_a, sin_a, -cos_a, 0, 0).map(self._ARROW_ALONG_X), x2, y2)
         
         # Draw text horizontally at midpoint, offset to the right
         mid_x = (x1 + x2) / 2
@@ -2075,16 +2323,30 @@ class BridgeCADWidget(QWidget):
         text_y = mid_y + 4
         
         self.draw_text_with_background(painter, text_x, text_y, text,
-                                    QColor(255, 255, 255, 240), QColor(0, 0, 0), 7, True)
+                                    self._COLOR_LABEL_BG, self._COLOR_BLACK, 7, True)
 
     def add_clean_top_view_notes(self, painter, height):
         """Add professional notes"""
         notes_y = height - 160
+        # pixmap starts above the "NOTES:" header background
+        origin_y = notes_y - 20
         
-        self.draw_text_with_background(painter, 30, notes_y + 5,
-                                    "NOTES:", QColor(240, 245, 250, 250),
-                                    QColor(0, 0, 0), 9, True)
+        if painter.hasClipping():
+            notes_rect = QRectF(0, origin_y, self.width(), height - origin_y)
+            if not painter.clipBoundingRect().intersects(notes_rect):
+                return
+        
+        dpr = painter.device().devicePixelRatioF()
+        # keyed on the skew as printed, sub-0.1° changes reuse the pixmap
+        key = (self.params['num_girders'], f"{self.params['skew_angle']:.1f}", dpr)
+        if key != self._notes_key:
+            self._notes_pixmap = self.render_notes_pixmap(dpr)
+            self._notes_key = key
         
+        painter.drawPixmap(0, int(origin_y), self._notes_pixmap)
+
+    def render_notes_pixmap(self, dpr):
+        """Render the notes block once into a transparent pixmap"""
         notes = [
             f"1. Green lines: Girders (Qty = {self.params['num_girders']})",
             f"2. Orange lines: Cross bracing (ISA 100×100×8)",
@@ -2094,20 +2356,84 @@ class BridgeCADWidget(QWidget):
             f"6. All dimensions in meters",
         ]
         
-        painter.setFont(QFont('Arial', 7))
-        painter.setPen(QPen(QColor(40, 40, 40), 1))
+        note_font = self._font_note
+        metrics = QFontMetrics(note_font)
+        width = 32 + max(metrics.horizontalAdvance(note) for note in notes) + 10
+        height = 42 + len(notes) * 13
+        
+        pix = QPixmap(int(width * dpr), int(height * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.draw_text_with_background(painter, 30, 25,
+                                    "NOTES:", QColor(240, 245, 250, 250),
+                                    self._COLOR_BLACK, 9, True)
+        
+        painter.setFont(note_font)
+        painter.setPen(self._PEN_NOTE)
         
         for i, note in enumerate(notes):
-            note_y = notes_y + 22 + i * 13
+            note_y = 42 + i * 13
             painter.drawText(32, note_y, note)
+        painter.end()
+        
+        return pix
+
+
+class _PngSaverSignals(QObject):
+    """signals of _PngSaver; QRunnable itself is not a QObject"""
+    finished = Signal(str, bool)
+
+
+class _PngSaver(QRunnable):
+    """encode and write an exported QImage off the GUI thread"""
+    
+    def __init__(self, image, path):
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.signals = _PngSaverSignals()
+        
+    def run(self):
+        ok = self.image.save(self.path, "PNG")
+        # queued back to the GUI thread, where the signals object lives
+        self.signals.finished.emit(self.path, ok)
 
 
 class BridgeDesignGUI(QMainWindow):
     """Main window for bridge design application"""
     
+    # status messages posted by update_bridge (values in metres)
+    _MSG_AUTO_ADJUST = "⚙ Auto-adjusted: Spacing={:.2f}m, Overhang={:.3f}m"
+    _MSG_SPACING_ADJ = "⚙ Girder Spacing adjusted to {:.2f}m"
+    _MSG_OVERHANG_ADJ = "Deck Overhang adjusted to {:.3f}m to match deck width"
+    
+    # one sheet for every control group, selected by the groupCategory property
+    _GROUP_CSS = """
+        QGroupBox { font-weight: bold; }
+        QGroupBox[groupCategory="general"] { color: #1e40af; }
+        QGroupBox[groupCategory="geometry"] { color: #059669; }
+        QGroupBox[groupCategory="deck"] { color: #7c3aed; }
+        QGroupBox[groupCategory="view"] { color: #ea580c; }
+    """
+    
+    # the only params compute_deck_total_width_mm reads
+    _DECK_WIDTH_KEYS = ('carriageway_width', 'crash_barrier_width', 'footpath_width',
+                        'footpath_config', 'median_present', 'median_width')
+    # footpaths per footpath_config, anything else has none
+    _FOOTPATH_COUNT = {'both': 2, 'left': 1, 'right': 1}
+    # limits (mm) the spacing/overhang solver in update_bridge clamps to
+    _OVERHANG_MIN_MM = 300
+    _OVERHANG_MAX_MM = 2000
+    _SPACING_MIN_MM = 1000
+    _SPACING_MAX_MM = 24000
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Steel Girder Bridge CAD")
+        self.setStyleSheet(self._GROUP_CSS)
 
         screen = QApplication.primaryScreen()
         available = screen.availableGeometry() if screen else None
@@ -2120,8 +2446,24 @@ class BridgeDesignGUI(QMainWindow):
         self.resize(default_width, default_height)
         self.setMinimumSize(900, 650)
         
-        self._updating = False
         self._last_changed = None
+        self._last_params = None
+        self._deck_width_cache = None  # (signature, deck_total, num_fp)
+        self._export_pixmap = None  # reused across exports, reallocated on resize
+        self._png_savers = set()  # keeps every running export job (and its signals) alive
+        
+        # coalesce bursts of edits into a single update_bridge call; typed values only
+        # arrive on commit (no keyboard tracking), so one frame's wait is enough
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(20)
+        self._update_timer.timeout.connect(self.update_bridge)
+        
+        # one restartable timer puts the status back to "Ready" after the last message
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.setInterval(8000)
+        self._status_reset_timer.timeout.connect(lambda: self.status_label.setText("Status: Ready"))
         
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -2138,32 +2480,30 @@ class BridgeDesignGUI(QMainWindow):
         splitter.addWidget(self.cad_widget)
         
         splitter.setSizes([380, 1200])
+        
+        # (param key, input widget, type, factor to mm) read by update_bridge
+        self._param_spec = [
+            ('span_length', self.span_input, float, 1000.0),
+            ('carriageway_width', self.carriageway_input, float, 1000.0),
+            ('skew_angle', self.skew_input, float, 1.0),
+            ('num_girders', self.girders_input, int, 1),
+            ('girder_spacing', self.spacing_input, float, 1000.0),
+            ('cross_bracing_spacing', self.bracing_spacing_input, float, 1000.0),
+            ('deck_thickness', self.deck_input, float, 1.0),
+            ('deck_overhang', self.deck_overhang_input, float, 1000.0),
+            ('footpath_width', self.fp_width_input, float, 1000.0),
+            ('footpath_thickness', self.fp_thick_input, float, 1.0),
+        ]
     
     def compute_deck_total_width_mm(self, params):
         """Compute total deck width including median if present"""
-        carriageway = params.get('carriageway_width', 10500)
-        crash_barrier = params.get('crash_barrier_width', 500)
-        footpath_width = params.get('footpath_width', 1500)
-        fp_config = params.get('footpath_config', 'both')
-        median_present = params.get('median_present', False)
-        median_width = params.get('median_width', 1200)
+        num_fp = self._FOOTPATH_COUNT.get(params['footpath_config'], 0)
         
-        if fp_config == 'both':
-            num_fp = 2
-        elif fp_config in ['left', 'right']:
-            num_fp = 1
-        else:
-            num_fp = 0
-        
-        if median_present:
-            deck_total = (carriageway + 
-                          median_width +
-                          2 * crash_barrier + 
-                          num_fp * footpath_width)
-        else:
-            deck_total = (carriageway + 
-                          2 * crash_barrier + 
-                          num_fp * footpath_width)
+        deck_total = (params['carriageway_width'] +
+                      2 * params['crash_barrier_width'] +
+                      num_fp * params['footpath_width'])
+        if params['median_present']:
+            deck_total += params['median_width']
         
         return deck_total, num_fp
         
@@ -2179,16 +2519,8 @@ class BridgeDesignGUI(QMainWindow):
         layout.addWidget(title)
         
         self.status_label = QLabel("Status: Ready")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                background-color: #f0f9ff;
-                color: #1e40af;
-                padding: 8px;
-                border: 1px solid #bfdbfe;
-                border-radius: 4px;
-                font-size: 9px;
-            }
-        """)
+        self.status_label.setStyleSheet(_STATUS_CSS_INFO)
+        self._current_status_css = _STATUS_CSS_INFO
         self.status_label.setWordWrap(True)
         self.status_label.setMinimumHeight(50)
         layout.addWidget(self.status_label)
@@ -2201,42 +2533,58 @@ class BridgeDesignGUI(QMainWindow):
         self.create_general_bridge_details(scroll_layout)
         self.create_geometry_group(scroll_layout)
         self.create_deck_footpath_group(scroll_layout)
-        self.create_view_controls(scroll_layout)
         
-        scroll_layout.addStretch()
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
         
-        self.create_action_buttons(layout)
+        # view selector and buttons are static, build them after the window is up
+        self._scroll_layout = scroll_layout
+        self._panel_layout = layout
+        self._deferred_built = False
+        QTimer.singleShot(0, self._build_deferred_controls)
         
         return panel
         
+    def _build_deferred_controls(self):
+        """Add the view selection group and action buttons (runs once)"""
+        if self._deferred_built:
+            return
+        self._deferred_built = True
+        
+        self.create_view_controls(self._scroll_layout)
+        self._scroll_layout.addStretch()
+        self.create_action_buttons(self._panel_layout)
+        
     def create_general_bridge_details(self, layout):
         """Create general bridge details - REMOVED median width input"""
         group = QGroupBox("General Bridge Details")
-        group.setStyleSheet("QGroupBox { font-weight: bold; color: #1e40af; }")
+        group.setProperty("groupCategory", "general")
         g = QGridLayout()
         
         r = 0
         
         g.addWidget(QLabel("Span (m):"), r, 0)
         self.span_input = QDoubleSpinBox()
+        self.span_input.setKeyboardTracking(False)
         self.span_input.setRange(20, 45)
         self.span_input.setValue(35)
         self.span_input.setSingleStep(0.5)
         self.span_input.setDecimals(1)
-        self.span_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.span_input.setToolTip("Range: 20-45 m")
+        self.span_input.setProperty("param_source", "other")
+        self.span_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.span_input, r, 1)
-        g.addWidget(QLabel("[20-45m]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Carriageway (m):"), r, 0)
         self.carriageway_input = QDoubleSpinBox()
+        self.carriageway_input.setKeyboardTracking(False)
         self.carriageway_input.setRange(4.25, 24.0)
         self.carriageway_input.setValue(10.5)
         self.carriageway_input.setSingleStep(0.25)
         self.carriageway_input.setDecimals(2)
-        self.carriageway_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.carriageway_input.setProperty("param_source", "other")
+        self.carriageway_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.carriageway_input, r, 1)
         r += 1
         
@@ -2245,7 +2593,8 @@ class BridgeDesignGUI(QMainWindow):
         self.median_combo = QComboBox()
         self.median_combo.addItems(["No", "Yes"])
         self.median_combo.setCurrentText("No")
-        self.median_combo.currentTextChanged.connect(lambda: self.on_param_changed('other'))
+        self.median_combo.setProperty("param_source", "other")
+        self.median_combo.currentTextChanged.connect(self._on_any_param_changed)
         g.addWidget(self.median_combo, r, 1)
         r += 1
                 
@@ -2253,19 +2602,22 @@ class BridgeDesignGUI(QMainWindow):
         self.footpath_combo = QComboBox()
         self.footpath_combo.addItems(["None", "Left", "Right", "Both"])
         self.footpath_combo.setCurrentText("Both")
-        self.footpath_combo.currentTextChanged.connect(lambda: self.on_param_changed('other'))
+        self.footpath_combo.setProperty("param_source", "other")
+        self.footpath_combo.currentTextChanged.connect(self._on_any_param_changed)
         g.addWidget(self.footpath_combo, r, 1)
         r += 1
         
         g.addWidget(QLabel("Skew Angle (°):"), r, 0)
         self.skew_input = QDoubleSpinBox()
+        self.skew_input.setKeyboardTracking(False)
         self.skew_input.setRange(-15.0, 15.0)
         self.skew_input.setValue(0.0)
         self.skew_input.setSingleStep(1.0)
         self.skew_input.setDecimals(1)
-        self.skew_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.skew_input.setToolTip("Range: -15° to +15°")
+        self.skew_input.setProperty("param_source", "other")
+        self.skew_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.skew_input, r, 1)
-        g.addWidget(QLabel("[-15° to +15°]"), r, 2)
         r += 1
         
         group.setLayout(g)
@@ -2274,52 +2626,61 @@ class BridgeDesignGUI(QMainWindow):
     def create_geometry_group(self, layout):
         """Create bridge geometry controls"""
         group = QGroupBox("Bridge Geometry")
-        group.setStyleSheet("QGroupBox { font-weight: bold; color: #059669; }")
+        group.setProperty("groupCategory", "geometry")
         g = QGridLayout()
         
         r = 0
         
         g.addWidget(QLabel("Number of Girders:"), r, 0)
         self.girders_input = QSpinBox()
+        self.girders_input.setKeyboardTracking(False)
         self.girders_input.setRange(2, 12)
         self.girders_input.setValue(4)
-        self.girders_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.girders_input.setToolTip("Range: 2-12")
+        self.girders_input.setProperty("param_source", "other")
+        self.girders_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.girders_input, r, 1)
-        g.addWidget(QLabel("[2-12]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Girder Spacing (m):"), r, 0)
         self.spacing_input = QDoubleSpinBox()
+        self.spacing_input.setKeyboardTracking(False)
         self.spacing_input.setRange(1.0, 24.0)
         self.spacing_input.setValue(2.75)
         self.spacing_input.setSingleStep(0.1)
+        self.spacing_input.setStepType(QAbstractSpinBox.AdaptiveDecimalStepType)
         self.spacing_input.setDecimals(2)
-        self.spacing_input.valueChanged.connect(lambda: self.on_param_changed('spacing'))
+        self.spacing_input.setToolTip("Range: 1.0-24.0 m")
+        self.spacing_input.setProperty("param_source", "spacing")
+        self.spacing_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.spacing_input, r, 1)
-        g.addWidget(QLabel("[1.0-24.0m]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Deck Overhang (m):"), r, 0)
         self.deck_overhang_input = QDoubleSpinBox()
+        self.deck_overhang_input.setKeyboardTracking(False)
         self.deck_overhang_input.setRange(0.1, 5.0)
         self.deck_overhang_input.setValue(1.0)
         self.deck_overhang_input.setSingleStep(0.05)
+        self.deck_overhang_input.setStepType(QAbstractSpinBox.AdaptiveDecimalStepType)
         self.deck_overhang_input.setDecimals(3)
         self.deck_overhang_input.setToolTip("Distance from outermost girder to deck edge (enforced: 300-2000mm)")
-        self.deck_overhang_input.valueChanged.connect(lambda: self.on_param_changed('overhang'))
+        self.deck_overhang_input.setProperty("param_source", "overhang")
+        self.deck_overhang_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.deck_overhang_input, r, 1)
-        g.addWidget(QLabel("[0.3-2.0m]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Bracing Spacing (m):"), r, 0)
         self.bracing_spacing_input = QDoubleSpinBox()
+        self.bracing_spacing_input.setKeyboardTracking(False)
         self.bracing_spacing_input.setRange(1.0, 45.0)
         self.bracing_spacing_input.setValue(3.5)
         self.bracing_spacing_input.setSingleStep(0.5)
         self.bracing_spacing_input.setDecimals(2)
-        self.bracing_spacing_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.bracing_spacing_input.setToolTip("Range: 1.0 m up to the span length")
+        self.bracing_spacing_input.setProperty("param_source", "other")
+        self.bracing_spacing_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.bracing_spacing_input, r, 1)
-        g.addWidget(QLabel("[1.0m-span]"), r, 2)
         r += 1
         
         group.setLayout(g)
@@ -2328,43 +2689,49 @@ class BridgeDesignGUI(QMainWindow):
     def create_deck_footpath_group(self, layout):
         """Create deck and footpath controls"""
         group = QGroupBox("Deck / Footpath Details")
-        group.setStyleSheet("QGroupBox { font-weight: bold; color: #7c3aed; }")
+        group.setProperty("groupCategory", "deck")
         g = QGridLayout()
         
         r = 0
         
         g.addWidget(QLabel("Deck Thickness (mm):"), r, 0)
         self.deck_input = QDoubleSpinBox()
+        self.deck_input.setKeyboardTracking(False)
         self.deck_input.setRange(0, 500)
         self.deck_input.setValue(200)
         self.deck_input.setSingleStep(10)
         self.deck_input.setDecimals(0)
-        self.deck_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.deck_input.setToolTip("Range: 0-500 mm")
+        self.deck_input.setProperty("param_source", "other")
+        self.deck_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.deck_input, r, 1)
-        g.addWidget(QLabel("[0-500mm]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Footpath Width (m):"), r, 0)
         self.fp_width_input = QDoubleSpinBox()
+        self.fp_width_input.setKeyboardTracking(False)
         self.fp_width_input.setRange(0.0, 10.0)
         self.fp_width_input.setValue(1.5)
         self.fp_width_input.setSingleStep(0.1)
+        self.fp_width_input.setStepType(QAbstractSpinBox.AdaptiveDecimalStepType)
         self.fp_width_input.setDecimals(2)
-        self.fp_width_input.setToolTip("IRC minimum: 1.5m when footpath is provided")
-        self.fp_width_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.fp_width_input.setToolTip("Range: 0-10.0 m (IRC minimum: 1.5m when footpath is provided)")
+        self.fp_width_input.setProperty("param_source", "other")
+        self.fp_width_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.fp_width_input, r, 1)
-        g.addWidget(QLabel("[0-10.0m]"), r, 2)
         r += 1
         
         g.addWidget(QLabel("Footpath Thick (mm):"), r, 0)
         self.fp_thick_input = QDoubleSpinBox()
+        self.fp_thick_input.setKeyboardTracking(False)
         self.fp_thick_input.setRange(0, 500)
         self.fp_thick_input.setValue(200)
         self.fp_thick_input.setSingleStep(10)
         self.fp_thick_input.setDecimals(0)
-        self.fp_thick_input.valueChanged.connect(lambda: self.on_param_changed('other'))
+        self.fp_thick_input.setToolTip("Range: 0-500 mm")
+        self.fp_thick_input.setProperty("param_source", "other")
+        self.fp_thick_input.valueChanged.connect(self._on_any_param_changed)
         g.addWidget(self.fp_thick_input, r, 1)
-        g.addWidget(QLabel("[0-500mm]"), r, 2)
         r += 1
         
         group.setLayout(g)
@@ -2373,7 +2740,7 @@ class BridgeDesignGUI(QMainWindow):
     def create_view_controls(self, layout):
         """Create view selection controls"""
         group = QGroupBox("View Selection")
-        group.setStyleSheet("QGroupBox { font-weight: bold; color: #ea580c; }")
+        group.setProperty("groupCategory", "view")
         v = QVBoxLayout()
         
         self.view_combo = QComboBox()
@@ -2406,186 +2773,147 @@ class BridgeDesignGUI(QMainWindow):
         else:
             self.cad_widget.set_view_type('top-view')
     
+    def _on_any_param_changed(self, _value=None):
+        """Shared slot for all inputs, the source tag is stored on the sender"""
+        self.on_param_changed(self.sender().property("param_source"))
+    
     def on_param_changed(self, source):
-        """Track what parameter changed and update"""
+        """Track what parameter changed and schedule an update"""
         self._last_changed = source
-        self.update_bridge()
+        self._update_timer.start()
     
     def update_status(self, message, is_warning=False):
         """Update the status label with notification"""
-        if is_warning:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background-color: #fef3c7;
-                    color: #92400e;
-                    padding: 8px;
-                    border: 1px solid #fbbf24;
-                    border-radius: 4px;
-                    font-size: 9px;
-                }
-            """)
-        else:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f9ff;
-                    color: #1e40af;
-                    padding: 8px;
-                    border: 1px solid #bfdbfe;
-                    border-radius: 4px;
-                    font-size: 9px;
-                }
-            """)
+        css = _STATUS_CSS_WARN if is_warning else _STATUS_CSS_INFO
+        if css is not self._current_status_css:
+            self.status_label.setStyleSheet(css)
+            self._current_status_css = css
         
         self.status_label.setText(message)
-        QTimer.singleShot(8000, lambda: self.status_label.setText("Status: Ready"))
+        self._status_reset_timer.start()
     
     def update_bridge(self):
         """Collect values, enforce formulas, and update CAD - FIXED for removed median width input"""
-        MIN_OVERHANG = 300
-        MAX_OVERHANG = 2000
-        
-        if self._updating:
-            return
-        
-        self._updating = True
-        
-        try:
-            params = {}
-            
-            params['span_length'] = float(self.span_input.value()) * 1000.0
-            params['carriageway_width'] = float(self.carriageway_input.value()) * 1000.0
-            params['skew_angle'] = float(self.skew_input.value())
-            params['footpath_config'] = self.footpath_combo.currentText().lower()
-            
-            # MEDIAN PARAMETERS - Fixed width of 1.2m (1200mm)
-            params['median_present'] = self.median_combo.currentText() == "Yes"
-            params['median_width'] = 1200.0  # Fixed value, no input
-            
-            params['num_girders'] = int(self.girders_input.value())
-            params['girder_spacing'] = float(self.spacing_input.value()) * 1000.0
-            params['cross_bracing_spacing'] = float(self.bracing_spacing_input.value()) * 1000.0
-            params['crash_barrier_width'] = 500.0
-            
-            params['deck_thickness'] = float(self.deck_input.value())
-            params['deck_overhang'] = float(self.deck_overhang_input.value()) * 1000.0
-            params['footpath_width'] = float(self.fp_width_input.value()) * 1000.0
-            params['footpath_thickness'] = float(self.fp_thick_input.value())
-            params['railing_height'] = 1000.0
-            params['railing_width'] = 100.0
-            
+        MIN_OVERHANG = self._OVERHANG_MIN_MM
+        MAX_OVERHANG = self._OVERHANG_MAX_MM
+        MIN_SPACING = self._SPACING_MIN_MM
+        MAX_SPACING = self._SPACING_MAX_MM
+        
+        params = {key: convert(widget.value()) * factor
+                  for key, widget, convert, factor in self._param_spec}
+        params['footpath_config'] = self.footpath_combo.currentText().lower()
+        
+        # MEDIAN PARAMETERS - Fixed width of 1.2m (1200mm)
+        params['median_present'] = self.median_combo.currentText() == "Yes"
+        params['median_width'] = 1200.0  # Fixed value, no input
+        
+        params['crash_barrier_width'] = 500.0
+        params['railing_height'] = 1000.0
+        params['railing_width'] = 100.0
+        
+        # auto-adjusted values are written back without re-triggering on_param_changed
+        with QSignalBlocker(self.spacing_input), \
+             QSignalBlocker(self.deck_overhang_input), \
+             QSignalBlocker(self.bracing_spacing_input):
             if params['cross_bracing_spacing'] > params['span_length']:
                 params['cross_bracing_spacing'] = params['span_length']
-                self.bracing_spacing_input.blockSignals(True)
                 self.bracing_spacing_input.setValue(params['span_length'] / 1000.0)
-                self.bracing_spacing_input.blockSignals(False)
-            
-            deck_total, num_fp = self.compute_deck_total_width_mm(params)
-            n = params['num_girders']
-            
+        
+            # span, skew, bracing and thickness edits leave the deck width as it was
+            deck_sig = tuple(params[k] for k in self._DECK_WIDTH_KEYS)
+            if self._deck_width_cache is None or self._deck_width_cache[0] != deck_sig:
+                self._deck_width_cache = (deck_sig,) + self.compute_deck_total_width_mm(params)
+            _, deck_total, num_fp = self._deck_width_cache
+            # girder bays the solver shares the deck between
+            bays = params['num_girders'] - 1
+        
             if self._last_changed == 'overhang':
-                if n > 1:
-                    new_spacing = (deck_total - 2 * params['deck_overhang']) / (n - 1)
-                    new_spacing = max(1000, min(24000, new_spacing))
-                    
+                if bays > 0:
+                    new_spacing = (deck_total - 2 * params['deck_overhang']) / bays
+                    new_spacing = max(MIN_SPACING, min(MAX_SPACING, new_spacing))
+                
                     if abs(new_spacing - params['girder_spacing']) > 1:
-                        params['girder_spacing'] = new_spacing
-                        self.spacing_input.blockSignals(True)
-                        self.spacing_input.setValue(new_spacing / 1000.0)
-                        self.spacing_input.blockSignals(False)
-                        self.update_status(f"⚙ Girder Spacing adjusted to {new_spacing/1000:.2f}m")
-                        
+                        self._apply_geometry(params, new_spacing, params['deck_overhang'],
+                                             self._MSG_SPACING_ADJ.format(new_spacing / 1000))
+                    
             elif self._last_changed == 'spacing':
-                if n > 1:
-                    new_overhang = (deck_total - params['girder_spacing'] * (n - 1)) / 2.0
+                if bays > 0:
+                    new_overhang = (deck_total - params['girder_spacing'] * bays) / 2.0
                 else:
                     new_overhang = deck_total / 2.0
-                
+            
                 new_overhang = max(MIN_OVERHANG, min(MAX_OVERHANG, new_overhang))
                 if abs(new_overhang - params['deck_overhang']) > 1:
-                    params['deck_overhang'] = new_overhang
-                    self.deck_overhang_input.blockSignals(True)
-                    self.deck_overhang_input.setValue(new_overhang / 1000.0)
-                    self.deck_overhang_input.blockSignals(False)
-                    self.update_status(f"Deck Overhang adjusted to {new_overhang/1000:.3f}m to match deck width")
-                    
+                    self._apply_geometry(params, params['girder_spacing'], new_overhang,
+                                         self._MSG_OVERHANG_ADJ.format(new_overhang / 1000))
+                
             else:
-                if n > 1:
-                    required_overhang = (deck_total - params['girder_spacing'] * (n - 1)) / 2.0
+                if bays > 0:
+                    required_overhang = (deck_total - params['girder_spacing'] * bays) / 2.0
                 else:
                     required_overhang = deck_total / 2.0
-                
-                if required_overhang < MIN_OVERHANG:
-                    if n > 1:
-                        new_spacing = (deck_total - 2 * MIN_OVERHANG) / (n - 1)
-                        new_spacing = max(1000, min(24000, new_spacing))
-                        params['girder_spacing'] = new_spacing
-                        params['deck_overhang'] = MIN_OVERHANG
-                        
-                        self.spacing_input.blockSignals(True)
-                        self.spacing_input.setValue(new_spacing / 1000.0)
-                        self.spacing_input.blockSignals(False)
-                        
-                        self.deck_overhang_input.blockSignals(True)
-                        self.deck_overhang_input.setValue(MIN_OVERHANG / 1000.0)
-                        self.deck_overhang_input.blockSignals(False)
-                        
-                        self.update_status(f"⚙ Auto-adjusted: Spacing={new_spacing/1000:.2f}m, Overhang={MIN_OVERHANG/1000:.3f}m")
-                    else:
-                        params['deck_overhang'] = MIN_OVERHANG
-                        self.deck_overhang_input.blockSignals(True)
-                        self.deck_overhang_input.setValue(MIN_OVERHANG / 1000.0)
-                        self.deck_overhang_input.blockSignals(False)
-                        
-                elif required_overhang > MAX_OVERHANG:
-                    if n > 1:
-                        new_spacing = (deck_total - 2 * MAX_OVERHANG) / (n - 1)
-                        new_spacing = max(1000, min(24000, new_spacing))
-                        params['girder_spacing'] = new_spacing
-                        params['deck_overhang'] = MAX_OVERHANG
-                        
-                        self.spacing_input.blockSignals(True)
-                        self.spacing_input.setValue(new_spacing / 1000.0)
-                        self.spacing_input.blockSignals(False)
-                        
-                        self.deck_overhang_input.blockSignals(True)
-                        self.deck_overhang_input.setValue(MAX_OVERHANG / 1000.0)
-                        self.deck_overhang_input.blockSignals(False)
-                        
-                        self.update_status(f"⚙ Auto-adjusted: Spacing={new_spacing/1000:.2f}m, Overhang={MAX_OVERHANG/1000:.3f}m")
+                new_overhang = max(MIN_OVERHANG, min(MAX_OVERHANG, required_overhang))
+            
+                if new_overhang != required_overhang:
+                    # overhang pinned to a limit: spacing takes up the rest of the deck
+                    if bays > 0:
+                        new_spacing = (deck_total - 2 * new_overhang) / bays
+                        new_spacing = max(MIN_SPACING, min(MAX_SPACING, new_spacing))
+                        self._apply_geometry(params, new_spacing, new_overhang,
+                                             self._MSG_AUTO_ADJUST.format(new_spacing / 1000,
+                                                                          new_overhang / 1000))
                     else:
-                        params['deck_overhang'] = MAX_OVERHANG
-                        self.deck_overhang_input.blockSignals(True)
-                        self.deck_overhang_input.setValue(MAX_OVERHANG / 1000.0)
-                        self.deck_overhang_input.blockSignals(False)
-                else:
-                    if abs(required_overhang - params['deck_overhang']) > 1:
-                        params['deck_overhang'] = required_overhang
-                        self.deck_overhang_input.blockSignals(True)
-                        self.deck_overhang_input.setValue(required_overhang / 1000.0)
-                        self.deck_overhang_input.blockSignals(False)
-            
+                        self._apply_geometry(params, params['girder_spacing'], new_overhang)
+                elif abs(required_overhang - params['deck_overhang']) > 1:
+                    self._apply_geometry(params, params['girder_spacing'], required_overhang)
+        
+        # identical params (double-fired signals, re-entered values) need no redraw;
+        # params is built fresh each call, so the last dict is compared as is
+        if params != self._last_params:
+            self._last_params = params
             self.cad_widget.update_params(params)
-            
-        finally:
-            self._updating = False
+        
+    def _apply_geometry(self, params, new_spacing, new_overhang, msg=None):
+        """Write adjusted spacing/overhang (mm) into params and the inputs; callers block signals"""
+        if new_spacing != params['girder_spacing']:
+            params['girder_spacing'] = new_spacing
+            self.spacing_input.setValue(new_spacing / 1000.0)
+        if new_overhang != params['deck_overhang']:
+            params['deck_overhang'] = new_overhang
+            self.deck_overhang_input.setValue(new_overhang / 1000.0)
+        if msg:
+            self.update_status(msg)
         
     def reset_defaults(self):
         """Reset to default values per specification"""
-        self._last_changed = 'other'
+        # may run before the queued control build (view_combo lives there)
+        self._build_deferred_controls()
+        
+        defaults = [
+            (self.span_input, 35.0),
+            (self.girders_input, 4),
+            (self.spacing_input, 2.75),
+            (self.bracing_spacing_input, 3.5),
+            (self.carriageway_input, 10.5),
+            (self.skew_input, 0.0),
+            (self.deck_input, 200),
+            (self.deck_overhang_input, 1.0),
+            (self.fp_width_input, 1.5),
+            (self.fp_thick_input, 200),
+        ]
         
-        self.span_input.setValue(35.0)
-        self.girders_input.setValue(4)
-        self.spacing_input.setValue(2.75)
-        self.bracing_spacing_input.setValue(3.5)
-        self.carriageway_input.setValue(10.5)
-        self.skew_input.setValue(0.0)
-        self.deck_input.setValue(200)
-        self.deck_overhang_input.setValue(1.0)
-        self.fp_width_input.setValue(1.5)
-        self.fp_thick_input.setValue(200)
-        self.footpath_combo.setCurrentText("Both")
+        # write every default silently, then recompute exactly once below
+        for widget, value in defaults:
+            with QSignalBlocker(widget):
+                widget.setValue(value)
+        with QSignalBlocker(self.footpath_combo):
+            self.footpath_combo.setCurrentText("Both")
+        # left unblocked, on_view_changed switches the CAD view
         self.view_combo.setCurrentIndex(0)
         
+        # solved as a plain edit, neither spacing nor overhang leads
+        self._update_timer.stop()
+        self._last_changed = 'other'
         self.update_bridge()
         self.update_status("Reset to default values (Span=35m, N=4, Spacing=2.75m, Carriageway=10.5m)")
         
@@ -2599,10 +2927,28 @@ class BridgeDesignGUI(QMainWindow):
             "PNG Files (*.png)"
         )
         if fname:
-            pix = QPixmap(self.cad_widget.size())
-            self.cad_widget.render(pix)
-            pix.save(fname, "PNG")
+            size = self.cad_widget.size()
+            if self._export_pixmap is None or self._export_pixmap.size() != size:
+                self._export_pixmap = QPixmap(size)
+            self._export_pixmap.fill(Qt.transparent)
+            self.cad_widget.render(self._export_pixmap)
+            
+            # rendering has to stay on the GUI thread; PNG compression does not
+            # an earlier export may still be saving, each job is held until it reports back
+            saver = _PngSaver(self._export_pixmap.toImage(), fname)
+            saver.signals.finished.connect(
+                lambda fname, ok, saver=saver: self._on_export_finished(saver, fname, ok))
+            self._png_savers.add(saver)
+            self.update_status(f"Exporting to: {fname}")
+            QThreadPool.globalInstance().start(saver)
+            
+    def _on_export_finished(self, saver, fname, ok):
+        """Report the result of a background PNG export and release its job"""
+        self._png_savers.discard(saver)
+        if ok:
             self.update_status(f"✓ Exported to: {fname}")
+        else:
+            self.update_status(f"⚠ Could not write: {fname}", is_warning=True)
 
 
 def main():
@@ -2613,7 +2959,8 @@ def main():
     window = BridgeDesignGUI()
     window.show()
     
-    window.reset_defaults()
+    # queued behind the deferred control build
+    QTimer.singleShot(0, window.reset_defaults)
     
     sys.exit(app.exec())
 